@@ -23,6 +23,7 @@ from ..scorelib.iterable_dict import *
 from ..scorelib.consts import *
 
 from ..interfaces.address_registrar import *
+from ..domain.domain import *
 
 from .consts import *
 
@@ -36,6 +37,9 @@ class AlreadyRegisteredException(Exception):
 class NotRegisteredException(Exception):
     pass
 
+class StaleCursorException(Exception):
+    pass
+
 
 class AddressRegistrar(
     IconScoreBase,
@@ -43,10 +47,15 @@ class AddressRegistrar(
     IconScoreVersion,
 ):
     _NAME = "ADDRESS_REGISTRAR"
+    # The registrations cursor is made of the epoch followed by the offset
+    _CURSOR_OFFSET_BITS = 32
 
     # ================================================
     #  Event Logs
     # ================================================
+    @eventlog(indexed=1)
+    def DomainPushSkipped(self, member: Address, reason: str):
+        pass
 
     # ================================================
     #  Initialization
@@ -56,6 +65,10 @@ class AddressRegistrar(
         self._owners = SetDB(f"{AddressRegistrar._NAME}_owners", self.db, Address)
         self._address_register = IterableDictDB(f"{AddressRegistrar._NAME}_address_register", self.db, Address, str)
         self._name_register = IterableDictDB(f"{AddressRegistrar._NAME}_name_register", self.db, str, Address)
+        # Incremented on every change of the registrar
+        self._epoch = VarDB(f"{AddressRegistrar._NAME}_epoch", self.db, value_type=int)
+        # Incremented on every change of the domain pushed to the domain contracts
+        self._domain_epoch = VarDB(f"{AddressRegistrar._NAME}_domain_epoch", self.db, value_type=int)
 
     def on_install(self) -> None:
         super().on_install()
@@ -71,6 +84,10 @@ class AddressRegistrar(
         # if self.is_less_than_target_version('1.0.0'):
         #     self._migrate_v1_0_0()
 
+        # Fill the local copy of the domain contracts deployed before the registrar pushed the domain
+        self.__bump_domain_epoch()
+        self.__push_domain_all()
+
         self.version_update(VERSION)
 
     @external(readonly=True)
@@ -100,6 +117,62 @@ class AddressRegistrar(
         if not (address in self._name_register):
             raise NotRegisteredException(AddressRegistrar._NAME, str(address))
 
+    def __bump_epoch(self) -> None:
+        self._epoch.set(self._epoch.get() + 1)
+
+    def __domain_proxy(self, address: Address):
+        # Only the domain contracts keep a local copy of the domain addresses
+        if not address or not address.is_contract or address == self.address:
+            return None
+        return self.create_interface_score(address, ABCAddressRegistrarProxy)
+
+    def __bump_domain_epoch(self) -> None:
+        self._domain_epoch.set(self._domain_epoch.get() + 1)
+
+    def __check_push_failure(self, address: Address, error: BaseException) -> None:
+        # Only skip the members that don't accept the pushes from this registrar : not upgraded yet,
+        # or configured with another registrar. Their local copy doesn't match the registrar
+        # domain epoch anymore, so they resolve the domain from their registrar instead
+        reason = type(error).__name__
+        if reason not in ("MethodNotFoundException", SenderNotRegistrarException.__name__):
+            raise error
+        self.DomainPushSkipped(address, reason)
+
+    def __push_domain(self, address: Address) -> None:
+        # Push the whole domain to the local copy of a domain contract, in a single call
+        proxy = self.__domain_proxy(address)
+        if not proxy:
+            return
+
+        names = []
+        addresses = []
+        for name in DOMAIN_NAMES:
+            member = self._address_register[name]
+            if member:
+                names.append(name)
+                addresses.append(member)
+
+        try:
+            proxy.on_registrar_synchronize(names, addresses, self._domain_epoch.get())
+        except BaseException as error:
+            self.__check_push_failure(address, error)
+
+    def __push_domain_all(self) -> None:
+        # Push the domain to every registered domain contract : one call per domain contract
+        for name in DOMAIN_NAMES:
+            self.__push_domain(self._address_register[name])
+
+    def __push_domain_reset(self, address: Address) -> None:
+        # Discard the local copy of an unregistered domain contract
+        proxy = self.__domain_proxy(address)
+        if not proxy:
+            return
+
+        try:
+            proxy.on_registrar_reset()
+        except BaseException as error:
+            self.__check_push_failure(address, error)
+
     # ================================================
     #  External methods
     # ================================================
@@ -127,6 +200,11 @@ class AddressRegistrar(
         # --- OK from here ---
         self._address_register[name] = address
         self._name_register[address] = name
+        self.__bump_epoch()
+
+        if name in DOMAIN_NAMES:
+            self.__bump_domain_epoch()
+            self.__push_domain_all()
 
     @external
     def unregister(self, name: str) -> None:
@@ -152,6 +230,33 @@ class AddressRegistrar(
         # --- OK from here ---
         del self._name_register[address]
         del self._address_register[name]
+        self.__bump_epoch()
+
+        if name in DOMAIN_NAMES:
+            self.__bump_domain_epoch()
+            self.__push_domain_all()
+            self.__push_domain_reset(address)
+
+    @external
+    def synchronize(self, name: str) -> None:
+        # Access
+        #   - AddressRegistrar contract owner only
+        # Description
+        #   - Push the whole domain again to the local copy of a registered domain contract
+        # Parameters
+        #   - name : Name of the domain contract
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderIsNotOwner
+        #   - NotRegisteredException
+
+        # --- Checks ---
+        self.__check_owner(self.msg.sender)
+        self.__check_name_exists(name)
+
+        # --- OK from here ---
+        self.__push_domain(self._address_register[name])
 
     @external(readonly=True)
     def resolve(self, name: str) -> Address:
@@ -169,6 +274,49 @@ class AddressRegistrar(
     def reverse_resolve_many(self, addresses: List[Address]) -> List[str]:
         return list(map(lambda address: self.reverse_resolve(address), addresses[0:MAX_ITERATION_LOOP]))
 
+    @external(readonly=True)
+    def get_epoch(self) -> int:
+        # Changes every time a name or an owner is added or removed,
+        # so a copy of the registrar can be revalidated with a single read
+        return self._epoch.get()
+
+    @external(readonly=True)
+    def get_domain_epoch(self) -> int:
+        # Changes every time a domain contract is registered or unregistered,
+        # the domain contracts only use their local copy if it has been pushed with this epoch
+        return self._domain_epoch.get()
+
+    @external(readonly=True)
+    def get_registrations(self, cursor: int = 0) -> dict:
+        # Returns a page of the name:address registrations, starting from a given cursor.
+        # The cursor of the next page is 0 once all the registrations have been returned.
+        # The cursor carries the epoch of the registrar, as the registrations order changes
+        # with the registrar : a cursor from a previous epoch raises StaleCursorException,
+        # and the registrations should be read again from the start
+        epoch = self._epoch.get()
+        offset = 0
+
+        if cursor:
+            if cursor >> AddressRegistrar._CURSOR_OFFSET_BITS != epoch:
+                raise StaleCursorException(AddressRegistrar._NAME, cursor)
+            offset = cursor & ((1 << AddressRegistrar._CURSOR_OFFSET_BITS) - 1)
+
+        items = self._address_register.select(offset)
+        next_cursor = 0
+        if len(items) == MAX_ITERATION_LOOP:
+            next_cursor = (epoch << AddressRegistrar._CURSOR_OFFSET_BITS) | (offset + len(items))
+
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+            "epoch": epoch
+        }
+
+    @external(readonly=True)
+    def is_domain_member(self, address: Address) -> bool:
+        # The name register is the reverse index of the domain
+        return self._name_register[address] in DOMAIN_NAMES
+
     # --- Owners management ---
     @external(readonly=True)
     def get_owners(self, offset: int = 0) -> list:
@@ -188,6 +336,7 @@ class AddressRegistrar(
         # Throws
         #   - SenderNotScoreOwnerError
         self._owners.add(address)
+        self.__bump_epoch()
 
     @external
     @only_owner
@@ -204,3 +353,4 @@ class AddressRegistrar(
         #   - SenderNotScoreOwnerError
         #   - ItemNotFound
         self._owners.remove(address)
+        self.__bump_epoch()
@@ -17,6 +17,7 @@
 from iconservice import *
 
 from ..scorelib.id_factory import *
+from ..scorelib.struct import *
 
 
 class BalanceHistoryFactory:
@@ -29,10 +30,12 @@ class BalanceHistoryFactory:
         balance_history_uid = IdFactory(BalanceHistoryFactory._NAME, db).get_uid()
 
         balance_history = BalanceHistory(balance_history_uid, db)
-        balance_history._token.set(token)
-        balance_history._transaction_uid.set(transaction_uid)
-        balance_history._balance.set(balance)
-        balance_history._timestamp.set(timestamp)
+        balance_history._record.create({
+            "token": token,
+            "transaction_uid": transaction_uid,
+            "balance": balance,
+            "timestamp": timestamp
+        })
 
         return balance_history_uid
 
@@ -46,10 +49,16 @@ class BalanceHistory:
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
         name = f"{BalanceHistory._NAME}_{uid}"
-        self._token = VarDB(f"{name}_token", db, value_type=Address)
-        self._transaction_uid = VarDB(f"{name}_transaction_uid", db, value_type=int)
-        self._balance = VarDB(f"{name}_balance", db, value_type=int)
-        self._timestamp = VarDB(f"{name}_timestamp", db, value_type=int)
+        self._record = StructDB(name, db, [
+            ("token", Address),
+            ("transaction_uid", int),
+            ("balance", int),
+            ("timestamp", int),
+        ])
+        self._token = self._record.field("token")
+        self._transaction_uid = self._record.field("transaction_uid")
+        self._balance = self._record.field("balance")
+        self._timestamp = self._record.field("timestamp")
         self._uid = uid
 
     # ================================================
@@ -18,6 +18,8 @@ from iconservice import *
 
 from ..scorelib.maintenance import *
 from ..scorelib.version import *
+from ..scorelib.auth import *
+from ..scorelib.consts import *
 from ..scorelib.set import *
 from ..scorelib.linked_list import *
 
@@ -43,7 +45,7 @@ class BalanceHistoryManager(
     # ================================================
     #  Event Logs
     # ================================================
-    @add_event
+    @add_event(uid_arg="balance_history_uid")
     @eventlog(indexed=1)
     def BalanceHistoryCreated(self, balance_history_uid: int):
         pass
@@ -71,6 +73,10 @@ class BalanceHistoryManager(
         # if self.is_less_than_target_version('1.0.0'):
         #     self._migrate_v1_0_0()
 
+        # The balance history lists switched to the packed layout, migrate the first nodes
+        # of the tracked tokens. The remaining nodes are migrated with migrate_balance_history
+        self.__migrate_balance_history(MAX_ITERATION_LOOP)
+
         self.version_update(VERSION)
 
     @external(readonly=True)
@@ -101,7 +107,7 @@ class BalanceHistoryManager(
     
     def __get_total_staked_icx(self) -> int:
         amount = 0
-        transaction_mgr = self.registrar.resolve(TransactionManagerProxy.NAME)
+        transaction_mgr = self.resolve_domain(TransactionManagerProxy.NAME)
         
         try:
             system_score = self.create_interface_score(SYSTEM_SCORE_ADDRESS, InterfaceSystemScore)
@@ -122,7 +128,7 @@ class BalanceHistoryManager(
 
     def __update_icx_balance(self, transaction_uid: int) -> None:
         # ICX Balance = Liquid ICX + Staked ICX
-        transaction_mgr = self.registrar.resolve(TransactionManagerProxy.NAME)
+        transaction_mgr = self.resolve_domain(TransactionManagerProxy.NAME)
         if transaction_mgr:
             current_balance = self.icx.get_balance(transaction_mgr)
             current_balance += self.__get_total_staked_icx()
@@ -133,7 +139,7 @@ class BalanceHistoryManager(
 
     def __update_irc2_balance(self, transaction_uid: int, token: Address) -> None:
         irc2 = self.create_interface_score(token, IRC2Interface)
-        transaction_mgr = self.registrar.resolve(TransactionManagerProxy.NAME)
+        transaction_mgr = self.resolve_domain(TransactionManagerProxy.NAME)
         if transaction_mgr:
             current_balance = irc2.balanceOf(transaction_mgr)
         else:
@@ -141,6 +147,14 @@ class BalanceHistoryManager(
 
         self.__update_token_balance(transaction_uid, token, current_balance)
 
+    def __migrate_balance_history(self, max_count: int) -> None:
+        # Only migrate the first tracked token history that isn't migrated yet, so no more than max_count nodes are migrated
+        for token in self._tracked_balance_history:
+            token_balance_history = self.__token_balance_history(token)
+            if not token_balance_history.is_migrated():
+                token_balance_history.migrate(max_count)
+                return
+
     def __update_all_balances(self, transaction_uid: int):
         for token in self._tracked_balance_history:
             if token == ICX_TOKEN_ADDRESS:
@@ -148,11 +162,37 @@ class BalanceHistoryManager(
             else:
                 self.__update_irc2_balance(transaction_uid, token)
 
+    # ================================================
+    #  OnlyOwner External methods
+    # ================================================
+    @external
+    @only_owner
+    def migrate_balance_history(self, token: Address, max_count: int = MAX_ITERATION_LOOP) -> None:
+        # Access
+        #   - BalanceHistoryManager contract operator only
+        # Description 
+        #   - Migrate a limited amount of nodes of a token balance history stored with the legacy layout.
+        #     Call it until get_balance_history_migrated returns True.
+        #     The history of untracked tokens is only migrated this way
+        # Parameters 
+        #   - token : the token governance contract address
+        #   - max_count : maximum amount of nodes migrated, up to MAX_ITERATION_LOOP
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotScoreOwnerError
+        self.__token_balance_history(token).migrate(min(max_count, MAX_ITERATION_LOOP))
+
+    @external(readonly=True)
+    def get_balance_history_migrated(self, token: Address) -> bool:
+        return self.__token_balance_history(token).is_migrated()
+
     # ================================================
     #  OnlyTransactionManager External methods
     # ================================================
     @external
     @only_transaction_manager
+    @batch_events
     def update_all_balances(self, transaction_uid: int):
         # Access
         #   - Only Transaction Manager Contract
@@ -171,6 +211,7 @@ class BalanceHistoryManager(
     # ================================================
     @external
     @only_iconsafe
+    @batch_events
     def add_balance_tracker(self, token: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy Contract
@@ -187,6 +228,7 @@ class BalanceHistoryManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def remove_balance_tracker(self, token: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy Contract
@@ -211,6 +253,14 @@ class BalanceHistoryManager(
             for balance_history_uid in self.__token_balance_history(token).select(offset)
         ]
 
+    @external(readonly=True)
+    def get_token_balance_history_from(self, token: Address, cursor: int = 0) -> dict:
+        balance_history_uids, next_cursor = self.__token_balance_history(token).select_from(cursor)
+        return {
+            "items": [self.get_balance_history(balance_history_uid) for balance_history_uid in balance_history_uids],
+            "next_cursor": next_cursor
+        }
+
     @external(readonly=True)
     def get_balance_history(self, balance_history_uid: int) -> dict:
         return BalanceHistory(balance_history_uid, self.db).serialize()
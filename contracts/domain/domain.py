@@ -55,12 +55,7 @@ def only_domain(func):
     @wraps(func)
     def __wrapper(self: object, *args, **kwargs):
 
-        domain = self.registrar.resolve_many(DOMAIN_NAMES)
-        
-        if None in domain:
-            raise AddressNotInRegistrar(', '.join(DOMAIN_NAMES))
-
-        if not self.msg.sender in domain:
+        if not self.is_domain_member(self.msg.sender):
             raise SenderNotInDomainException(self.msg.sender)
 
         return func(self, *args, **kwargs)
@@ -76,7 +71,7 @@ def only_iconsafe(func):
     def __wrapper(self: object, *args, **kwargs):
 
         name = IconSafeProxy.NAME
-        iconsafe = self.registrar.resolve(name)
+        iconsafe = self.resolve_domain(name)
         if not iconsafe:
             raise AddressNotInRegistrar(name)
 
@@ -96,7 +91,7 @@ def only_transaction_manager(func):
     def __wrapper(self: object, *args, **kwargs):
 
         name = TransactionManagerProxy.NAME
-        transaction_manager = self.registrar.resolve(name)
+        transaction_manager = self.resolve_domain(name)
         if not transaction_manager:
             raise AddressNotInRegistrar(name)
 
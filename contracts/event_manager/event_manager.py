@@ -17,7 +17,10 @@
 from iconservice import *
 from ..scorelib.maintenance import *
 from ..scorelib.version import *
+from ..scorelib.auth import *
+from ..scorelib.consts import *
 from ..scorelib.linked_list import *
+from ..scorelib.codec import *
 
 from ..interfaces.event_manager import *
 from ..interfaces.address_registrar import *
@@ -37,13 +40,16 @@ class EventManager(
 ):
 
     _NAME = "EVENT_MANAGER"
+    # Layout of an event record : txhash, emitter, event type, primary uid
+    _RECORD_TYPES = [bytes, Address, str, int]
 
     # ================================================
     #  Initialization
     # ================================================
     def __init__(self, db: IconScoreDatabase) -> None:
         super().__init__(db)
-        self._events = LinkedListDB(f"{EventManager._NAME}_events", self.db, value_type=bytes)
+        self._events = LinkedListDB(f"{EventManager._NAME}_events", self.db, value_type=bytes, packed=True)
+        self._records = LinkedListDB(f"{EventManager._NAME}_records", self.db, value_type=bytes, packed=True)
 
     def on_install(self, registrar_address: Address) -> None:
         super().on_install()
@@ -57,37 +63,98 @@ class EventManager(
         # if self.is_less_than_target_version('1.0.0'):
         #     self._migrate_v1_0_0()
 
+        # The events list switched to the packed layout, migrate its first nodes.
+        # The remaining nodes are migrated with migrate_events
+        self._events.migrate()
+
         self.version_update(VERSION)
 
     @external(readonly=True)
     def name(self) -> str:
         return EventManager._NAME
 
+    # ================================================
+    #  Private methods
+    # ================================================
+    def __emitter_records(self, emitter: Address) -> UIDLinkedListDB:
+        return UIDLinkedListDB(f"{EventManager._NAME}_{str(emitter)}_emitter_records", self.db)
+
+    def __type_records(self, event_type: str) -> UIDLinkedListDB:
+        return UIDLinkedListDB(f"{EventManager._NAME}_{event_type}_type_records", self.db)
+
+    def __add_record(self, emitter: Address, event_type: str, uid: int) -> None:
+        record = Codec.encode([self.tx.hash, emitter, event_type, uid], EventManager._RECORD_TYPES)
+        record_uid = self._records.prepend(record)
+        self.__emitter_records(emitter).prepend(record_uid)
+        self.__type_records(event_type).prepend(record_uid)
+
+    def __serialize_record(self, record_uid: int, record: bytes) -> dict:
+        txhash, emitter, event_type, uid = Codec.decode(record, EventManager._RECORD_TYPES)
+        return {
+            "uid": record_uid,
+            "hash": txhash,
+            "emitter": emitter,
+            "type": event_type,
+            "primary_uid": uid
+        }
+
+    def __serialize_records_from(self, records: UIDLinkedListDB, cursor: int) -> dict:
+        record_uids, next_cursor = records.select_from(cursor)
+        return {
+            "items": [self.__serialize_record(record_uid, self._records.node_value(record_uid)) for record_uid in record_uids],
+            "next_cursor": next_cursor
+        }
+
+    # ================================================
+    #  OnlyOwner External methods
+    # ================================================
+    @external
+    @only_owner
+    def migrate_events(self, max_count: int = MAX_ITERATION_LOOP) -> None:
+        # Access
+        #   - EventManager contract operator only
+        # Description 
+        #   - Migrate a limited amount of events stored with the legacy layout to the packed layout.
+        #     Call it until get_events_migrated returns True
+        # Parameters 
+        #   - max_count : maximum amount of events migrated, up to MAX_ITERATION_LOOP
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotScoreOwnerError
+        self._events.migrate(min(max_count, MAX_ITERATION_LOOP))
+
     # ================================================
     #  OnlyDomain External methods
     # ================================================
     @external
     @only_domain
-    def on_add_event(self) -> None:
+    def on_add_event(self, records: str = "") -> None:
         # Access
         #   - Only addresses registered in the ICONSafe domain
         # Description 
         #   - Add a new event to the event manager
         # Parameters 
-        #   - Nothing
+        #   - records : JSON formated list of [eventlog name, primary UID] emitted by the sender,
+        #               such as [["WalletOwnerAddition", 4], ["WalletOwnerAddition", 5]].
+        #               The primary UID is the transaction UID, wallet owner UID, ...
         # Returns
         #   - Nothing
         # Throws
         #   - AddressNotInRegistrar
         #   - SenderNotInDomainException
 
-        # A same tx may trigger multiple events
-        if len(self._events) > 0 and self._events.head_value() == self.tx.hash:
+        if not self.tx:  # deploy transaction may not have a txhash yet
             return
 
-        if self.tx:  # deploy transaction may not have a txhash yet
+        # A same tx may trigger multiple events
+        if not (len(self._events) > 0 and self._events.head_value() == self.tx.hash):
             self._events.prepend(self.tx.hash)
 
+        if records:
+            for event_type, uid in json_loads(records):
+                self.__add_record(self.msg.sender, event_type, uid)
+
     # ================================================
     #  ReadOnly External methods
     # ================================================
@@ -97,3 +164,31 @@ class EventManager(
             {"uid": event_uid, "hash": event_hash} 
             for event_uid, event_hash in self._events.select(offset)
         ]
+
+    @external(readonly=True)
+    def get_events_migrated(self) -> bool:
+        return self._events.is_migrated()
+
+    @external(readonly=True)
+    def get_events_from(self, cursor: int = 0) -> dict:
+        events, next_cursor = self._events.select_from(cursor)
+        return {
+            "items": [{"uid": event_uid, "hash": event_hash} for event_uid, event_hash in events],
+            "next_cursor": next_cursor
+        }
+
+    @external(readonly=True)
+    def get_event_records_from(self, cursor: int = 0) -> dict:
+        records, next_cursor = self._records.select_from(cursor)
+        return {
+            "items": [self.__serialize_record(record_uid, record) for record_uid, record in records],
+            "next_cursor": next_cursor
+        }
+
+    @external(readonly=True)
+    def get_emitter_event_records_from(self, emitter: Address, cursor: int = 0) -> dict:
+        return self.__serialize_records_from(self.__emitter_records(emitter), cursor)
+
+    @external(readonly=True)
+    def get_type_event_records_from(self, event_type: str, cursor: int = 0) -> dict:
+        return self.__serialize_records_from(self.__type_records(event_type), cursor)
@@ -79,14 +79,14 @@ class ICONSafe(
     @payable
     @check_maintenance
     def fallback(self):
-        transaction_mgr = self.registrar.resolve(TransactionManagerProxy.NAME)
+        transaction_mgr = self.resolve_domain(TransactionManagerProxy.NAME)
         self.icx.transfer(transaction_mgr, self.msg.value)
         self.transaction_manager.handle_incoming_transaction(ICX_TOKEN_ADDRESS, self.msg.sender, self.msg.value)
 
     @external
     @check_maintenance
     def tokenFallback(self, _from: Address, _value: int, _data: bytes) -> None:
-        transaction_mgr = self.registrar.resolve(TransactionManagerProxy.NAME)
+        transaction_mgr = self.resolve_domain(TransactionManagerProxy.NAME)
         irc2 = self.create_interface_score(self.msg.sender, IRC2Interface)
         irc2.transfer(transaction_mgr, _value, _data)
         self.transaction_manager.handle_incoming_transaction(self.msg.sender, _from, _value)
@@ -112,6 +112,10 @@ class ICONSafe(
     def get_token_balance_history(self, token: Address, offset: int = 0) -> list:
         return self.balance_history_manager.get_token_balance_history(token, offset)
 
+    @external(readonly=True)
+    def get_token_balance_history_from(self, token: Address, cursor: int = 0) -> dict:
+        return self.balance_history_manager.get_token_balance_history_from(token, cursor)
+
     @external(readonly=True)
     def get_balance_history(self, balance_history_uid: int) -> dict:
         return self.balance_history_manager.get_balance_history(balance_history_uid)
@@ -160,6 +164,22 @@ class ICONSafe(
     def get_events(self, offset: int = 0) -> list:
         return self.event_manager.get_events(offset)
 
+    @external(readonly=True)
+    def get_events_from(self, cursor: int = 0) -> dict:
+        return self.event_manager.get_events_from(cursor)
+
+    @external(readonly=True)
+    def get_event_records_from(self, cursor: int = 0) -> dict:
+        return self.event_manager.get_event_records_from(cursor)
+
+    @external(readonly=True)
+    def get_emitter_event_records_from(self, emitter: Address, cursor: int = 0) -> dict:
+        return self.event_manager.get_emitter_event_records_from(emitter, cursor)
+
+    @external(readonly=True)
+    def get_type_event_records_from(self, event_type: str, cursor: int = 0) -> dict:
+        return self.event_manager.get_type_event_records_from(event_type, cursor)
+
     # ================================================
     #  AddressBook External methods
     # ================================================
@@ -267,6 +287,34 @@ class ICONSafe(
     def get_rejected_transactions(self, offset: int = 0) -> list:
         return self.transaction_manager.get_rejected_transactions(offset)
 
+    @external(readonly=True)
+    def get_waiting_transactions_from(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_waiting_transactions_from(cursor)
+
+    @external(readonly=True)
+    def get_all_transactions_from(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_all_transactions_from(cursor)
+
+    @external(readonly=True)
+    def get_executed_transactions_from(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_executed_transactions_from(cursor)
+
+    @external(readonly=True)
+    def get_rejected_transactions_from(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_rejected_transactions_from(cursor)
+
+    @external(readonly=True)
+    def get_all_transactions_reverse(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_all_transactions_reverse(cursor)
+
+    @external(readonly=True)
+    def get_executed_transactions_reverse(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_executed_transactions_reverse(cursor)
+
+    @external(readonly=True)
+    def get_rejected_transactions_reverse(self, cursor: int = 0) -> dict:
+        return self.transaction_manager.get_rejected_transactions_reverse(cursor)
+
     @external(readonly=True)
     def get_waiting_transactions_count(self) -> int:
         return self.transaction_manager.get_waiting_transactions_count()
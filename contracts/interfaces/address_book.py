@@ -57,7 +57,7 @@ class AddressBookProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def address_book(self):
-        address = self.registrar.resolve(AddressBookProxy.NAME)
+        address = self.resolve_domain(AddressBookProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(AddressBookProxy.NAME)
 
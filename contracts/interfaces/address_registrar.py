@@ -20,6 +20,9 @@ from ..scorelib.auth import *
 class AddressNotInRegistrar(Exception):
     pass
 
+class SenderNotRegistrarException(Exception):
+    pass
+
 class ABCAddressRegistrar(InterfaceScore):
 
     @interface
@@ -42,10 +45,26 @@ class ABCAddressRegistrar(InterfaceScore):
     def reverse_resolve_many(self, addresses: List[Address]) -> List[str]:
         pass
 
+    @interface
+    def is_domain_member(self, address: Address) -> bool:
+        pass
+
     @interface
     def get_owners(self, offset: int = 0) -> list:
         pass
 
+    @interface
+    def get_epoch(self) -> int:
+        pass
+
+    @interface
+    def get_domain_epoch(self) -> int:
+        pass
+
+    @interface
+    def get_registrations(self, cursor: int = 0) -> dict:
+        pass
+
     @interface
     def register(self, name: str, address: Address) -> None:
         pass
@@ -54,6 +73,10 @@ class ABCAddressRegistrar(InterfaceScore):
     def unregister(self, name: str) -> None:
         pass
 
+    @interface
+    def synchronize(self, name: str) -> None:
+        pass
+
     @interface
     def add_owner(self, address: Address) -> None:
         pass
@@ -63,6 +86,16 @@ class ABCAddressRegistrar(InterfaceScore):
         pass
 
 
+class ABCAddressRegistrarProxy(InterfaceScore):
+
+    @interface
+    def on_registrar_synchronize(self, names: List[str], addresses: List[Address], epoch: int) -> None:
+        pass
+
+    @interface
+    def on_registrar_reset(self) -> None:
+        pass
+
 
 class AddressRegistrarProxy:
 
@@ -75,15 +108,117 @@ class AddressRegistrarProxy:
     def __registrar_address(self) -> VarDB:
         return VarDB(f"{AddressRegistrarProxy.NAME}__registrar_address", self.db, Address)
 
+    @property
+    def __domain_epoch(self) -> VarDB:
+        return VarDB(f"{AddressRegistrarProxy.NAME}__domain_epoch", self.db, int)
+
+    @property
+    def __domain_registrar_epoch(self) -> VarDB:
+        # Registrar domain epoch of the local copy, 0 if it has never been pushed
+        return VarDB(f"{AddressRegistrarProxy.NAME}__domain_registrar_epoch", self.db, int)
+
+    @property
+    def __domain(self) -> DictDB:
+        # Local copy of the domain addresses, pushed by the registrar.
+        # Changing the epoch discards the whole copy
+        epoch = self.__domain_epoch.get()
+        return DictDB(f"{AddressRegistrarProxy.NAME}__domain_{epoch}", self.db, Address)
+
+    @property
+    def __domain_members(self) -> DictDB:
+        # Reverse index of the local copy : domain address -> name
+        epoch = self.__domain_epoch.get()
+        return DictDB(f"{AddressRegistrarProxy.NAME}__domain_members_{epoch}", self.db, str)
+
     @property
     def registrar(self):
         address = self.__registrar_address.get()
         return self.create_interface_score(address, ABCAddressRegistrar)
 
+    # ================================================
+    #  Private methods
+    # ================================================
+    def __check_registrar(self, address: Address) -> None:
+        if address != self.__registrar_address.get():
+            raise SenderNotRegistrarException(address)
+
+    def __reset_domain(self) -> None:
+        self.__domain_epoch.set(self.__domain_epoch.get() + 1)
+        self.__domain_registrar_epoch.set(0)
+
+    def __is_domain_synchronized(self) -> bool:
+        # The local copy is only used if it matches the current registrar domain,
+        # so a contract that missed a push resolves the domain from its registrar.
+        # The registrar domain epoch is read once per call
+        epoch = self.__domain_registrar_epoch.get()
+        if not epoch:
+            return False
+
+        registrar_epoch = getattr(self, "_registrar_domain_epoch", None)
+        if registrar_epoch is None:
+            registrar_epoch = self.registrar.get_domain_epoch()
+            self._registrar_domain_epoch = registrar_epoch
+
+        return epoch == registrar_epoch
+
     # ================================================
     #  Methods
     # ================================================
+    def resolve_domain(self, name: str) -> Address:
+        # Resolve a domain address from the local copy, or from the
+        # registrar if the local copy doesn't match the registrar domain
+        if self.__is_domain_synchronized():
+            return self.__domain[name]
+        return self.registrar.resolve(name)
+
+    def is_domain_member(self, address: Address) -> bool:
+        # Same than resolve_domain
+        if self.__is_domain_synchronized():
+            return self.__domain_members[address] != ""
+        return self.registrar.is_domain_member(address)
+
     @only_owner
     @external
     def set_registrar_address(self, address: Address) -> None:
         self.__registrar_address.set(address)
+        # The local copy belongs to the previous registrar
+        self.__reset_domain()
+        self._registrar_domain_epoch = None
+
+    @external
+    def on_registrar_synchronize(self, names: List[str], addresses: List[Address], epoch: int) -> None:
+        # Access
+        #   - AddressRegistrar only
+        # Description
+        #   - Replace the local copy with the whole domain of the registrar
+        # Parameters
+        #   - names : Names of the registered domain contracts
+        #   - addresses : Addresses of the registered domain contracts, in the same order than names
+        #   - epoch : Registrar domain epoch of the pushed domain
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotRegistrarException
+        self.__check_registrar(self.msg.sender)
+        self.__reset_domain()
+
+        domain = self.__domain
+        members = self.__domain_members
+        for name, address in zip(names, addresses):
+            domain[name] = address
+            members[address] = name
+
+        self.__domain_registrar_epoch.set(epoch)
+
+    @external
+    def on_registrar_reset(self) -> None:
+        # Access
+        #   - AddressRegistrar only
+        # Description
+        #   - Discard the local copy of the domain addresses
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotRegistrarException
+        self.__check_registrar(self.msg.sender)
+        self.__reset_domain()
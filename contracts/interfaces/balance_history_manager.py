@@ -28,6 +28,10 @@ class ABCBalanceHistoryManager(InterfaceScore):
     def get_token_balance_history(self, token: Address, offset: int = 0) -> list:
         pass
 
+    @interface
+    def get_token_balance_history_from(self, token: Address, cursor: int = 0) -> dict:
+        pass
+
     @interface
     def get_balance_history(self, balance_history_uid: int) -> dict:
         pass
@@ -58,7 +62,7 @@ class BalanceHistoryManagerProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def balance_history_manager(self):
-        address = self.registrar.resolve(BalanceHistoryManagerProxy.NAME)
+        address = self.resolve_domain(BalanceHistoryManagerProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(BalanceHistoryManagerProxy.NAME)
         
@@ -29,7 +29,23 @@ class ABCEventManager(InterfaceScore):
         pass
 
     @interface
-    def on_add_event(self) -> None:
+    def get_events_from(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_event_records_from(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_emitter_event_records_from(self, emitter: Address, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_type_event_records_from(self, event_type: str, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def on_add_event(self, records: str = "") -> None:
         pass
 
 
@@ -43,23 +59,90 @@ class EventManagerProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def event_manager(self):
-        address = self.registrar.resolve(EventManagerProxy.NAME)
+        address = self.resolve_domain(EventManagerProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(EventManagerProxy.NAME)
         return self.create_interface_score(address, ABCEventManager)
 
+    # ================================================
+    #  Methods
+    # ================================================
+    def register_event(self, event_type: str = "", uid: int = 0) -> None:
+        # Inside a batch, the record is sent with the other records of the external call
+        records = getattr(self, "_event_records", None)
+        if records is not None:
+            records.append([event_type, uid])
+            return
+
+        self.send_events([[event_type, uid]])
+
+    def send_events(self, records: list) -> None:
+        # Register the current transaction in the event manager along with the [event type, primary uid] records
+        try:
+            self.event_manager.on_add_event(json_dumps(records))
+        except AddressNotInRegistrar:
+            # Registrar may not be configured yet
+            pass
+
+
+def add_event(uid_arg: str = None):
+    # The primary UID of the record is the eventlog parameter named uid_arg,
+    # or 0 if the eventlog isn't about a single entity
+    def decorator(func):
+        if not isfunction(func):
+            revert('NotAFunctionError')
+
+        # Position of the primary UID in the eventlog arguments, without self
+        code = getattr(func, "__wrapped__", func).__code__
+        index = code.co_varnames[1:code.co_argcount].index(uid_arg) if uid_arg else None
+
+        @wraps(func)
+        def __wrapper(self: object, *args, **kwargs):
+            if index is None:
+                uid = 0
+            elif uid_arg in kwargs:
+                uid = kwargs[uid_arg]
+            else:
+                uid = args[index]
+            self.register_event(func.__name__, uid)
+            return func(self, *args, **kwargs)
 
-def add_event(func):
+        return __wrapper
+
+    return decorator
+
+
+def batch_events(func):
     if not isfunction(func):
         revert('NotAFunctionError')
 
     @wraps(func)
     def __wrapper(self: object, *args, **kwargs):
+        # Already batched by the calling method
+        records = getattr(self, "_event_records", None)
+        if records is not None:
+            # If the nested call fails, its state is reverted : drop its records
+            # so the calling method doesn't send them if it catches the failure
+            count = len(records)
+            try:
+                return func(self, *args, **kwargs)
+            except BaseException:
+                del records[count:]
+                raise
+
+        # Collect the records of all the eventlogs emitted during the external call,
+        # and send them to the event manager in a single call once it returns.
+        # If the call fails, its state is reverted and nothing is sent
+        self._event_records = []
         try:
-            self.event_manager.on_add_event()
-        except AddressNotInRegistrar:
-            # Registrar may not be configured yet
-            pass
-        return func(self, *args, **kwargs)
+            result = func(self, *args, **kwargs)
+            records = self._event_records
+        finally:
+            self._event_records = None
+
+        if records:
+            self.send_events(records)
+
+        return result
 
     return __wrapper
@@ -42,7 +42,7 @@ class IconSafeProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def iconsafe(self):
-        address = self.registrar.resolve(IconSafeProxy.NAME)
+        address = self.resolve_domain(IconSafeProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(IconSafeProxy.NAME)
         
@@ -52,6 +52,34 @@ class ABCTransactionManager(InterfaceScore):
     def get_rejected_transactions(self, offset: int = 0) -> list:
         pass
 
+    @interface
+    def get_waiting_transactions_from(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_all_transactions_from(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_executed_transactions_from(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_rejected_transactions_from(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_all_transactions_reverse(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_executed_transactions_reverse(self, cursor: int = 0) -> dict:
+        pass
+
+    @interface
+    def get_rejected_transactions_reverse(self, cursor: int = 0) -> dict:
+        pass
+
     @interface
     def get_waiting_transactions_count(self) -> int:
         pass
@@ -113,7 +141,7 @@ class TransactionManagerProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def transaction_manager(self):
-        address = self.registrar.resolve(TransactionManagerProxy.NAME)
+        address = self.resolve_domain(TransactionManagerProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(TransactionManagerProxy.NAME)
         
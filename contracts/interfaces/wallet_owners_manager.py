@@ -74,7 +74,7 @@ class WalletOwnersManagerProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def wallet_owners_manager(self):
-        address = self.registrar.resolve(WalletOwnersManagerProxy.NAME)
+        address = self.resolve_domain(WalletOwnersManagerProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(WalletOwnersManagerProxy.NAME)
         
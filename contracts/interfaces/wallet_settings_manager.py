@@ -42,7 +42,7 @@ class WalletSettingsManagerProxy(AddressRegistrarProxy):
     # ================================================
     @property
     def wallet_settings_manager(self):
-        address = self.registrar.resolve(WalletSettingsManagerProxy.NAME)
+        address = self.resolve_domain(WalletSettingsManagerProxy.NAME)
         if not address:
             raise AddressNotInRegistrar(WalletSettingsManagerProxy.NAME)
         
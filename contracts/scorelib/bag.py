@@ -35,44 +35,157 @@ class ScorelibStopIteration(Exception):
 class BagDB(object):
     # BagDB is an iterable collection of items that may have duplicates.
     # Order of retrieval is *optionally* significant (*not* significant by default)
+    # A BagDB with epochs is cleared in constant time : its items are moved to a new epoch namespace,
+    # and the items of the previous epochs may be deleted later using the purge method.
+    # An ordered BagDB with tombstones marks the removed slots instead of shifting the next items,
+    # the tombstones are skipped during iteration and compacted in bounded steps.
+    # A counted BagDB keeps the occurrence count of each item, so count and membership cost a single read.
+    # Counts should be enabled when the bag is created, as the existing items aren't counted.
 
     _NAME = '_BAGDB'
+    # Maximum count of items moved or deleted by a single compaction step
+    _COMPACTION_STEP = 8
 
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, order=False):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, order=False, epoch=False, tombstones=False, counted=False):
         self._name = var_key + BagDB._NAME
-        self._items = ArrayDB(f'{self._name}_items', db, value_type=value_type)
-        self._order = order
         self._db = db
+        # Subclasses may rename the bag, keep the names of the underlying storage
+        self._items_name = f'{self._name}_items'
+        self._garbage_name = f'{self._name}_garbage'
+        self._tombstones_name = f'{self._name}_tombstones'
+        self._counts_name = f'{self._name}_counts'
+        self._epoch = VarDB(f'{self._name}_epoch', db, int) if epoch else None
+        self._current_epoch = self._epoch.get() if epoch else 0
+        self._value_type = value_type
+        self._items = self._epoch_items(self._current_epoch)
+        self._order = order
+        self._tombstones = self._epoch_tombstones(self._current_epoch) if order and tombstones else None
+        self._removed = None
+        self._counts = self._epoch_counts(self._current_epoch) if counted else None
+
+    def _epoch_items(self, epoch: int) -> ArrayDB:
+        name = f'{self._items_name}_{epoch}' if epoch else self._items_name
+        return ArrayDB(name, self._db, value_type=self._value_type)
+
+    def _epoch_tombstones(self, epoch: int) -> VarDB:
+        name = f'{self._tombstones_name}_{epoch}' if epoch else self._tombstones_name
+        return VarDB(name, self._db, value_type=bytes)
+
+    def _epoch_counts(self, epoch: int) -> DictDB:
+        name = f'{self._counts_name}_{epoch}' if epoch else self._counts_name
+        return DictDB(name, self._db, value_type=int)
+
+    @staticmethod
+    def _decrement(counts: DictDB, item) -> None:
+        count = counts[item] - 1
+        if count > 0:
+            counts[item] = count
+        else:
+            del counts[item]
+
+    def _get_tombstones(self) -> int:
+        # Bitmap of the removed slots : the bit N is set if the slot N of the items array is a tombstone
+        if self._tombstones is None:
+            return 0
+        if self._removed is None:
+            data = self._tombstones.get()
+            self._removed = int.from_bytes(data, 'little') if data else 0
+        return self._removed
+
+    def _set_tombstones(self, removed: int) -> None:
+        if removed == self._removed:
+            return
+        self._removed = removed
+        if removed:
+            self._tombstones.set(removed.to_bytes((removed.bit_length() + 7) // 8, 'little'))
+        else:
+            self._tombstones.remove()
+
+    def _slot(self, index: int) -> int:
+        # Returns the slot of the items array containing the item at a given position
+        removed = self._get_tombstones()
+        if not removed:
+            return index
+
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                # Out of bounds
+                return len(self._items)
+
+        slot = 0
+        while removed >> slot:
+            if not (removed >> slot) & 1:
+                if index == 0:
+                    return slot
+                index -= 1
+            slot += 1
+
+        # There isn't any tombstone after this slot
+        return slot + index
 
     def __iter__(self):
-        for item in self._items:
-            yield item
+        removed = self._get_tombstones()
+        for slot, item in enumerate(self._items):
+            # Skip the tombstones
+            if not (removed >> slot) & 1:
+                yield item
+
+    def _iter_from(self, offset: int):
+        # Iterate the items from a given position without reading the previous items
+        items = self._items
+        removed = self._get_tombstones()
+        start = self._slot(offset) if offset > 0 else 0
+
+        if start == 0:
+            # Iterating the whole array reads its size only once
+            for slot, item in enumerate(items):
+                # Skip the tombstones
+                if not (removed >> slot) & 1:
+                    yield item
+            return
+
+        for slot in range(start, len(items)):
+            # Skip the tombstones
+            if not (removed >> slot) & 1:
+                yield items[slot]
 
     def __len__(self) -> int:
-        return len(self._items)
+        return len(self._items) - bin(self._get_tombstones()).count('1')
 
     def __getitem__(self, index: int):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        return self._items[index]
+        return self._items[self._slot(index)]
 
     def __setitem__(self, index: int, value):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        self._items[index] = value
+        slot = self._slot(index)
+        if self._counts is not None:
+            self._decrement(self._counts, self._items[slot])
+            self._counts[value] += 1
+        self._items[slot] = value
 
     def first(self):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        return self._items[0]
+        return self._items[self._slot(0)]
 
     def last(self):
         if not self._order:
             raise BagDBIsNotOrdered(self._name)
-        return self._items[len(self._items) - 1]
+        return self._items[self._slot(len(self) - 1)]
 
     def __contains__(self, item) -> bool:
-        return item in self._items
+        if self._counts is not None:
+            return self._counts[item] > 0
+        if self._tombstones is None:
+            return item in self._items
+        for cur in self:
+            if cur == item:
+                return True
+        return False
 
     def check_exists(self, item) -> None:
         if not item in self:
@@ -80,8 +193,11 @@ class BagDB(object):
 
     def count(self, item) -> int:
         # Returns the number of occurences of a given item in the bag 
+        if self._counts is not None:
+            return self._counts[item]
+
         count = 0
-        for cur in self._items:
+        for cur in self:
             if cur == item:
                 count += 1
         return count
@@ -89,20 +205,93 @@ class BagDB(object):
     def add(self, item) -> None:
         # Adds an item in the bag 
         self._items.put(item)
+        if self._counts is not None:
+            self._counts[item] += 1
 
     def pop(self):
-        return self._items.pop()
+        removed = self._get_tombstones()
+        if removed:
+            # The last slots may be tombstones
+            self._set_tombstones(self._trim(removed))
+        return self._pop_item(self._items, self._current_epoch)
 
     def clear(self) -> None:
         # Removes all the items from the bag 
-        while self._items:
-            self._items.pop()
+        if self._epoch is None:
+            while self._items:
+                self._pop_item(self._items, self._current_epoch)
+            if self._tombstones is not None:
+                self._set_tombstones(0)
+            return
+
+        if self._items:
+            # Keep track of the previous epoch, so its items can be purged later
+            self._garbage().put(self._current_epoch)
+
+        self._current_epoch += 1
+        self._epoch.set(self._current_epoch)
+        self._items = self._epoch_items(self._current_epoch)
+        if self._tombstones is not None:
+            self._tombstones = self._epoch_tombstones(self._current_epoch)
+            self._removed = None
+        if self._counts is not None:
+            self._counts = self._epoch_counts(self._current_epoch)
+
+    def _pop_item(self, items: ArrayDB, epoch: int):
+        # Remove the last item of the items of a given epoch
+        item = items.pop()
+        if self._counts is not None:
+            # Tombstones are popped by the clear operations too, so the counts may already be null
+            self._decrement(self._counts if epoch == self._current_epoch else self._epoch_counts(epoch), item)
+        return item
+
+    def _garbage(self) -> ArrayDB:
+        # Epochs left by the clear operations that still contain some items
+        return ArrayDB(self._garbage_name, self._db, value_type=int)
+
+    def purge(self, max_count: int = MAX_ITERATION_LOOP) -> bool:
+        # Delete a limited amount of the items left by the previous clear operations
+        # Returns True if there isn't any item left to delete
+        if self._epoch is None:
+            return True
+
+        garbage = self._garbage()
+        count = 0
+
+        while len(garbage) and count < max_count:
+            epoch = garbage[len(garbage) - 1]
+            items = self._epoch_items(epoch)
+
+            while items and count < max_count:
+                self._pop_item(items, epoch)
+                count += 1
+
+            if not items:
+                garbage.pop()
+                if self._tombstones is not None:
+                    self._epoch_tombstones(epoch).remove()
+
+        return len(garbage) == 0
 
     def remove(self, item) -> None:
         # This operation removes a given item from the bag.
         # If the item does not exist, it *does not raise* a KeyError.
         
-        if self._order:
+        if self._counts is not None:
+            if not self._counts[item]:
+                # No need to look for a missing item
+                return
+            self._decrement(self._counts, item)
+
+        if self._tombstones is not None:
+            # Replace the last matching item with a tombstone (ordered)
+            items = self._items
+            removed = self._get_tombstones()
+            for slot in range(len(items) - 1, -1, -1):
+                if not (removed >> slot) & 1 and items[slot] == item:
+                    self._remove_slot(slot)
+                    return
+        elif self._order:
             # Remove from the ArrayDB (ordered)
             tmp = []
             while self._items:
@@ -119,31 +308,74 @@ class BagDB(object):
                 self._items.put(cur)
         else:
             # Remove from the ArrayDB (unordered)
-            length = len(self._items)
             for idx, cur in enumerate(self._items):
                 # Look for the item index to be removed
                 if cur == item:
-                    if idx == length - 1:
-                        # Nothing left in the array
-                        self._items.pop()
-                    else:
-                        # Replace the old value with the tail of the array
-                        self._items[idx] = self._items.pop()
+                    self._swap_remove(idx)
                     return
 
+    def _swap_remove(self, index: int) -> None:
+        # Replace the item at a given index with the tail of the array (unordered)
+        last = self._items.pop()
+        if index < len(self._items):
+            self._items[index] = last
+            self._moved(last, index)
+
+    def _remove_slot(self, slot: int) -> None:
+        # Replace the item of a given slot with a tombstone (ordered)
+        removed = self._get_tombstones() | (1 << slot)
+        size = len(self._items)
+
+        if bin(removed).count('1') * 2 > size:
+            # Too many tombstones : move some items over them
+            removed = self._compact(removed, size)
+
+        self._set_tombstones(self._trim(removed, BagDB._COMPACTION_STEP))
+
+    def _compact(self, removed: int, size: int) -> int:
+        # Move a limited amount of items into the first tombstones, in order.
+        # The moved items leave a tombstone behind them, so the tombstones move toward the end of the array
+        for _ in range(BagDB._COMPACTION_STEP):
+            hole = (removed & -removed).bit_length() - 1
+            # Items stored after the first tombstone
+            following = (~removed & ((1 << size) - 1)) >> (hole + 1)
+            if not following:
+                # All the tombstones are at the end of the array
+                break
+            slot = hole + (following & -following).bit_length()
+            item = self._items[slot]
+            self._items[hole] = item
+            self._moved(item, hole)
+            removed ^= (1 << hole) | (1 << slot)
+
+        return removed
+
+    def _trim(self, removed: int, max_count: int = None) -> int:
+        # Delete the tombstones at the end of the array, returns the remaining tombstones
+        size = len(self._items)
+        count = 0
+
+        while size and (removed >> (size - 1)) & 1 and (max_count is None or count < max_count):
+            self._items.pop()
+            size -= 1
+            count += 1
+
+        return removed & ((1 << size) - 1)
+
+    def _moved(self, item, index: int) -> None:
+        # Called when an item has been moved to another index
+        pass
+
     def select(self, offset: int, cond=None, **kwargs) -> list:
         # Returns a limited amount of items in the BagDB that optionally fulfills a condition 
-        items = iter(self._items)
-        result = []
-
-        # Skip N items until offset
-        try:
-            for _ in range(offset):
-                next(items)
-        except StopIteration:
+        if offset > len(self):
             # Offset is bigger than the size of the bag
             raise ScorelibStopIteration(self._name)
 
+        # Seek directly to the offset
+        items = self._iter_from(offset)
+        result = []
+
         # Do a maximum iteration count of MAX_ITERATION_LOOP
         for _ in range(MAX_ITERATION_LOOP):
             try:
@@ -16,6 +16,7 @@
 
 from iconservice import *
 from .id_factory import *
+from .consts import *
 
 
 class TreeNodeAlreadyExists(Exception):
@@ -26,6 +27,10 @@ class TreeNodeNotFound(Exception):
     pass
 
 
+class InvalidTreeCursor(Exception):
+    pass
+
+
 class _BinaryTreeNode:
     # __BinaryTreeNode is an item of the BinaryTreeDB
     # Its structure is internal and shouldn't be manipulated outside of this module
@@ -56,6 +61,12 @@ class _BinaryTreeNode:
     def get_children(self) -> tuple:
         return self._left.get(), self._right.get()
 
+    def get_left(self) -> int:
+        return self._left.get()
+
+    def get_right(self) -> int:
+        return self._right.get()
+
     def get_value(self):
         return self._value.get()
 
@@ -73,6 +84,11 @@ class BinaryTreeDB:
 
     _NAME = '_BINARY_TREE'
 
+    # Traversal orders
+    PRE_ORDER = 0
+    IN_ORDER = 1
+    POST_ORDER = 2
+
     def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
         name = var_key + BinaryTreeDB._NAME
         self._value_type = value_type
@@ -129,33 +145,82 @@ class BinaryTreeDB:
         node = self._node(node_id)
         return node.get_children()
 
-    def traverse_post_order(self, node_id: int, callback, **kwargs) -> None:
-        node = self._node(node_id)
-        if not node.exists():
-            return
+    def _iterate(self, order: int, stack: list):
+        # Depth-first traversal using an explicit stack of (node_id, expanded) entries.
+        # The stack is updated in place, so it describes the remaining traversal
+        # whenever the iteration is suspended.
+        while stack:
+            node_id, expanded = stack.pop()
+
+            if expanded:
+                if order == BinaryTreeDB.PRE_ORDER:
+                    # The node has already been visited, visit its children
+                    left, right = self.get_children(node_id)
+                    stack.append((right, False))
+                    stack.append((left, False))
+                else:
+                    # The children have already been expanded, visit the node
+                    yield node_id
+                continue
+
+            node = self._node(node_id)
+            if not node.exists():
+                continue
+
+            if order == BinaryTreeDB.PRE_ORDER:
+                stack.append((node_id, True))
+                yield node_id
+                continue
+
+            left, right = node.get_children()
+            if order == BinaryTreeDB.IN_ORDER:
+                stack.append((right, False))
+                stack.append((node_id, True))
+                stack.append((left, False))
+            else:
+                stack.append((node_id, True))
+                stack.append((right, False))
+                stack.append((left, False))
+
+    def iterate(self, node_id: int, order: int, cursor: str = None):
+        # Iterate the node ids of the subtree of a given node in a given order.
+        # A cursor returned by the select method may be used to resume a traversal
+        stack = BinaryTreeDB._load_cursor(cursor) if cursor else [(node_id, False)]
+        return self._iterate(order, stack)
+
+    def select(self, node_id: int, order: int, cursor: str = None, max_count: int = MAX_ITERATION_LOOP) -> tuple:
+        # Returns a limited amount of node ids of the subtree of a given node in a given order,
+        # and a cursor resuming the traversal in another call (None when the traversal is complete)
+        stack = BinaryTreeDB._load_cursor(cursor) if cursor else [(node_id, False)]
+        items = self._iterate(order, stack)
+        result = []
+
+        while len(result) < max_count:
+            try:
+                result.append(next(items))
+            except StopIteration:
+                break
+
+        if not stack:
+            return result, None
+
+        return result, json_dumps([[entry_id, expanded] for entry_id, expanded in stack])
+
+    @staticmethod
+    def _load_cursor(cursor: str) -> list:
+        try:
+            return [(int(node_id), bool(expanded)) for node_id, expanded in json_loads(cursor)]
+        except Exception:
+            raise InvalidTreeCursor(cursor)
 
-        left, right = node.get_children()
-        self.traverse_post_order(left, callback, **kwargs)
-        self.traverse_post_order(right, callback, **kwargs)
-        callback(self._db, node_id, **kwargs)
+    def traverse_post_order(self, node_id: int, callback, **kwargs) -> None:
+        for node in self.iterate(node_id, BinaryTreeDB.POST_ORDER):
+            callback(self._db, node, **kwargs)
 
     def traverse_in_order(self, node_id: int, callback, **kwargs) -> None:
-        node = self._node(node_id)
-        if not node.exists():
-            return
-
-        left, right = node.get_children()
-        self.traverse_in_order(left, callback, **kwargs)
-        callback(self._db, node_id, **kwargs)
-        self.traverse_in_order(right, callback, **kwargs)
+        for node in self.iterate(node_id, BinaryTreeDB.IN_ORDER):
+            callback(self._db, node, **kwargs)
 
     def traverse_pre_order(self, node_id: int, callback, **kwargs) -> None:
-        node = self._node(node_id)
-        if not node.exists():
-            return
-
-        callback(self._db, node_id, **kwargs)
-
-        left, right = node.get_children()
-        self.traverse_pre_order(left, callback, **kwargs)
-        self.traverse_pre_order(right, callback, **kwargs)
+        for node in self.iterate(node_id, BinaryTreeDB.PRE_ORDER):
+            callback(self._db, node, **kwargs)
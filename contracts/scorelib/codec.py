@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2021 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+
+class InvalidCodecType(Exception):
+    pass
+
+
+class InvalidCodecData(Exception):
+    pass
+
+
+class Codec:
+    # Codec packs a list of typed values into a single bytes value,
+    # so multiple fields can be stored in a single DB slot.
+    # Each field is prefixed with its length + 1, a null length means a default value.
+    # Decoding a value with less fields than expected returns the default value for the
+    # missing fields, so new fields may be appended to an existing layout later.
+
+    @staticmethod
+    def default(value_type: type):
+        # Same default values than VarDB
+        if value_type == int:
+            return 0
+        elif value_type == str:
+            return ""
+        elif value_type == bool:
+            return False
+        return None
+
+    @staticmethod
+    def encode_value(value, value_type: type) -> bytes:
+        if value is None:
+            return None
+        if value_type == int:
+            return value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True) if value else None
+        elif value_type == str:
+            return value.encode('utf-8') if value else None
+        elif value_type == bool:
+            return b'\x01' if value else None
+        elif value_type == bytes:
+            return value
+        elif value_type == Address:
+            return value.to_bytes()
+        raise InvalidCodecType(value_type)
+
+    @staticmethod
+    def decode_value(data: bytes, value_type: type):
+        if data is None:
+            return Codec.default(value_type)
+        if value_type == int:
+            return int.from_bytes(data, 'big', signed=True)
+        elif value_type == str:
+            return data.decode('utf-8')
+        elif value_type == bool:
+            return data != b''
+        elif value_type == bytes:
+            return data
+        elif value_type == Address:
+            return Address.from_bytes(data)
+        raise InvalidCodecType(value_type)
+
+    @staticmethod
+    def encode(values: list, types: list) -> bytes:
+        result = bytearray()
+        for value, value_type in zip(values, types):
+            data = Codec.encode_value(value, value_type)
+            Codec._write_length(result, len(data) + 1 if data is not None else 0)
+            if data:
+                result += data
+        return bytes(result)
+
+    @staticmethod
+    def decode(data: bytes, types: list) -> list:
+        result = []
+        offset = 0
+        for value_type in types:
+            if offset >= len(data):
+                # Field appended after the value has been encoded
+                result.append(Codec.default(value_type))
+                continue
+            length, offset = Codec._read_length(data, offset)
+            if length == 0:
+                result.append(Codec.default(value_type))
+                continue
+            end = offset + length - 1
+            if end > len(data):
+                raise InvalidCodecData(data)
+            result.append(Codec.decode_value(data[offset:end], value_type))
+            offset = end
+        return result
+
+    @staticmethod
+    def _write_length(result: bytearray, length: int) -> None:
+        # Unsigned LEB128
+        while length >= 0x80:
+            result.append((length & 0x7F) | 0x80)
+            length >>= 7
+        result.append(length)
+
+    @staticmethod
+    def _read_length(data: bytes, offset: int) -> tuple:
+        length = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise InvalidCodecData(data)
+            byte = data[offset]
+            offset += 1
+            length |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return length, offset
+            shift += 7
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2021 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .codec import *
+from .consts import *
+
+
+class HeapDB(object):
+    # HeapDB is a priority queue of values, the value with the lowest priority being retrieved first.
+    # It is stored as a binary min-heap in an ArrayDB, each slot containing a priority and its value.
+    # Pushing or popping a value costs O(log n), peeking the lowest priority costs O(1).
+
+    _NAME = '_HEAPDB'
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
+        self._name = var_key + HeapDB._NAME
+        self._items = ArrayDB(f'{self._name}_items', db, value_type=bytes)
+        self._types = [int, value_type]
+        self._db = db
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _get(self, index: int) -> list:
+        return Codec.decode(self._items[index], self._types)
+
+    def _set(self, index: int, entry: list) -> None:
+        self._items[index] = Codec.encode(entry, self._types)
+
+    def push(self, priority: int, value) -> None:
+        size = len(self._items)
+
+        # Look for the parents moved down to make room for the new entry
+        index = size
+        moved = []
+        while index > 0:
+            parent = (index - 1) // 2
+            entry = self._get(parent)
+            if entry[0] <= priority:
+                break
+            moved.append((index, entry))
+            index = parent
+        moved.append((index, [priority, value]))
+
+        # The first entry is appended to the array, the others replace the moved entries
+        self._items.put(Codec.encode(moved[0][1], self._types))
+        for index, entry in moved[1:]:
+            self._set(index, entry)
+
+    def peek(self) -> tuple:
+        # Returns the (priority, value) with the lowest priority without removing it, or None if the heap is empty
+        size = len(self._items)
+        if not size:
+            return None
+        priority, value = self._get(0)
+        return priority, value
+
+    def pop(self) -> tuple:
+        # Removes and returns the (priority, value) with the lowest priority, or None if the heap is empty
+        size = len(self._items)
+        if not size:
+            return None
+
+        priority, value = self._get(0)
+        last = Codec.decode(self._items.pop(), self._types)
+        size -= 1
+
+        if size:
+            # Move the smallest children up until the last entry finds its place
+            index = 0
+            while True:
+                child = 2 * index + 1
+                if child >= size:
+                    break
+                entry = self._get(child)
+                if child + 1 < size:
+                    right = self._get(child + 1)
+                    if right[0] < entry[0]:
+                        child, entry = child + 1, right
+                if last[0] <= entry[0]:
+                    break
+                self._set(index, entry)
+                index = child
+
+            self._set(index, last)
+
+        return priority, value
+
+    def pop_due(self, priority: int, max_count: int = MAX_ITERATION_LOOP) -> list:
+        # Removes and returns a limited amount of (priority, value) with a priority lower or equal to a given priority,
+        # in ascending order of priority
+        result = []
+        while len(result) < max_count:
+            head = self.peek()
+            if head is None or head[0] > priority:
+                break
+            result.append(self.pop())
+        return result
+
+    def clear(self) -> None:
+        while self._items:
+            self._items.pop()
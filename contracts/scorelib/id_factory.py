@@ -30,5 +30,13 @@ class IdFactory:
     def get_uid(self) -> int:
         # UID = 0 is forbidden in order to prevent conflict with uninitialized uid
         # Starts with UID 1
-        self._uid.set(self._uid.get() + 1)
-        return self._uid.get()
+        uid = self._uid.get() + 1
+        self._uid.set(uid)
+        return uid
+
+    def reserve(self, count: int) -> range:
+        # Returns a range of <count> contiguous UIDs, reserved with a single read and write
+        first = self._uid.get() + 1
+        if count > 0:
+            self._uid.set(first + count - 1)
+        return range(first, first + max(count, 0))
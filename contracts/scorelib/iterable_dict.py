@@ -16,6 +16,7 @@
 
 from iconservice import *
 from .set import *
+from .codec import *
 from .consts import *
 
 
@@ -26,39 +27,122 @@ class ScorelibStopIteration(Exception):
     pass
 
 
+class _IterableDictEntriesDB(BagDB):
+    # Array of the key,value pairs of a packed IterableDictDB, packed in a single slot.
+    # The slot of each key is indexed, so a pair may be updated or removed in place.
+    # Ordered entries are removed using tombstones.
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, key_type: type, value_type: type, order: bool):
+        super().__init__(var_key, db, bytes, order=order, tombstones=order)
+        self._types = [key_type, value_type]
+        self._indexes = DictDB(f'{self._name}_indexes', db, value_type=int)
+
+    def decode(self, entry: bytes) -> tuple:
+        key, value = Codec.decode(entry, self._types)
+        return key, value
+
+    def has(self, key) -> bool:
+        return key in self._indexes
+
+    def put(self, key, value) -> bool:
+        # Returns True if the key has been added
+        entry = Codec.encode([key, value], self._types)
+        # The index of a key is its slot in the array + 1
+        index = self._indexes[key]
+        if index:
+            self._items[index - 1] = entry
+            return False
+
+        self.add(entry)
+        self._indexes[key] = len(self._items)
+        return True
+
+    def delete(self, key) -> bool:
+        # Returns True if the key has been removed
+        index = self._indexes[key]
+        if not index:
+            return False
+
+        del self._indexes[key]
+        if self._order:
+            self._remove_slot(index - 1)
+        else:
+            self._swap_remove(index - 1)
+        return True
+
+    def _moved(self, entry: bytes, index: int) -> None:
+        key, _ = self.decode(entry)
+        self._indexes[key] = index + 1
+
+    def _pop_item(self, items: ArrayDB, epoch: int):
+        entry = super()._pop_item(items, epoch)
+        key, _ = self.decode(entry)
+        del self._indexes[key]
+        return entry
+
+
 class IterableDictDB(object):
     # Utility class wrapping the state DB.
     # IterableDictDB behaves like a DictDB, but supports iterator operation at a higher step cost.
     # Order of retrieval during iteration is *optionally* significant (*not* significant by default)
+    # A packed IterableDictDB stores the values next to the keys, so iterating the pairs costs a
+    # single read per pair. The values are still stored in a DictDB for the point lookups.
     
     _NAME = '_ITERABLE_DICTDB'
 
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, key_type: type, order=False):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, key_type: type, order=False, packed=False):
         self._name = var_key + IterableDictDB._NAME
-        self._keys = SetDB(f'{self._name}_keys', db, key_type, order)
+        if packed:
+            self._keys = None
+            self._entries = _IterableDictEntriesDB(f'{self._name}_entries', db, key_type, value_type, order)
+        else:
+            self._keys = SetDB(f'{self._name}_keys', db, key_type, order)
+            self._entries = None
         self._values = DictDB(f'{self._name}_values', db, value_type)
         self._db = db
 
     def __iter__(self):
+        if self._entries is not None:
+            for entry in self._entries:
+                yield self._entries.decode(entry)
+            return
+
         for key in self._keys:
             yield key, self._values[key]
 
     def keys(self):
+        if self._entries is not None:
+            for key, _ in self:
+                yield key
+            return
+
         for key in self._keys:
             yield key
 
     def values(self):
+        if self._entries is not None:
+            for _, value in self:
+                yield value
+            return
+
         for key in self._keys:
             yield self._values[key]
 
     def __contains__(self, key) -> bool:
+        if self._entries is not None:
+            return self._entries.has(key)
         return key in self._keys
 
     def __len__(self) -> int:
+        if self._entries is not None:
+            return len(self._entries)
         return len(self._keys)
 
     def __setitem__(self, key: str, value) -> None:
-        self._keys.add(key)
+        if self._entries is not None:
+            self._entries.put(key, value)
+        else:
+            self._keys.add(key)
         self._values[key] = value
 
     def __getitem__(self, key: str):
@@ -68,27 +152,65 @@ class IterableDictDB(object):
         if not key in self:
             raise ItemNotFound(self._name, str(key))
         del self._values[key]
-        self._keys.remove(key)
+        if self._entries is not None:
+            self._entries.delete(key)
+        else:
+            self._keys.remove(key)
+
+    def set_many(self, items: dict) -> list:
+        # Sets multiple key,value pairs, returns whether each key has been added
+        if self._entries is not None:
+            added = [self._entries.put(key, value) for key, value in items.items()]
+        else:
+            added = self._keys.add_many(items.keys())
+        for key, value in items.items():
+            self._values[key] = value
+        return added
+
+    def remove_many(self, keys) -> list:
+        # Removes multiple keys, returns whether each key has been removed
+        # Missing keys *do not raise* a ItemNotFound.
+        keys = list(keys)
+        if self._entries is not None:
+            removed = [self._entries.delete(key) for key in keys]
+        else:
+            removed = self._keys.remove_many(keys)
+        for key, exists in zip(keys, removed):
+            if exists:
+                del self._values[key]
+        return removed
+
+    def contains_many(self, keys) -> list:
+        # Returns whether each key exists in the dict
+        if self._entries is not None:
+            return [self._entries.has(key) for key in keys]
+        return self._keys.contains_many(keys)
+
+    def _iter_from(self, offset: int):
+        # Iterate the key,value pairs from a given position
+        if self._entries is not None:
+            for entry in self._entries._iter_from(offset):
+                yield self._entries.decode(entry)
+            return
+
+        for key in self._keys._iter_from(offset):
+            yield key, self._values[key]
 
     def select(self, offset: int, cond=None, **kwargs) -> dict:
         # Returns a limited amount of items in the IterableDictDB that optionally fulfills a condition
 
-        keys = iter(self._keys)
-        result = []
-
-        # Skip N items until offset
-        try:
-            for _ in range(offset):
-                next(keys)
-        except StopIteration:
+        if offset > len(self):
             # Offset is bigger than the size of the bag
             raise ScorelibStopIteration(self._name)
 
+        # Seek directly to the offset
+        items = self._iter_from(offset)
+        result = []
+
         # Do a maximum iteration count of MAX_ITERATION_LOOP
         for _ in range(MAX_ITERATION_LOOP):
             try:
-                key = next(keys)
-                item = (key, self._values[key])
+                item = next(items)
                 if cond:
                     if cond(self._db, item, **kwargs):
                         result.append(item)
@@ -108,4 +230,7 @@ class IterableDictDB(object):
             del self._values[key]
         
         # Remove keys
-        self._keys.clear()
+        if self._entries is not None:
+            self._entries.clear()
+        else:
+            self._keys.clear()
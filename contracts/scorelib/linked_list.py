@@ -16,6 +16,7 @@
 
 from iconservice import *
 from .id_factory import *
+from .codec import *
 from .consts import *
 
 
@@ -41,7 +42,8 @@ class ScorelibStopIteration(Exception):
 class _NodeDB:
     # NodeDB is an item of the LinkedListDB
     # Its structure is internal and shouldn't be manipulated outside of this module
-    
+    # Each field is stored in its own slot, and is written as soon as it is set
+
     _NAME = '_NODEDB'
     _UNINITIALIZED = 0
     _INITIALIZED = 1
@@ -60,6 +62,13 @@ class _NodeDB:
         self._next.remove()
         self._init.remove()
 
+    def save(self) -> None:
+        # Fields are already written when set
+        pass
+
+    def is_legacy(self) -> bool:
+        return False
+
     def exists(self) -> bool:
         return self._init.get() != _NodeDB._UNINITIALIZED
 
@@ -83,51 +92,617 @@ class _NodeDB:
         self._prev.set(prev_id)
 
 
+class _PackedNodeDB:
+    # PackedNodeDB is an item of a LinkedListDB in packed mode
+    # Its structure is internal and shouldn't be manipulated outside of this module
+    # The value and the links of the node are packed in a single slot : it is read once,
+    # and only written when saved.
+    # A node that is still stored with the legacy layout is read from its legacy slots,
+    # and migrated to the packed layout as soon as it is saved.
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, fallback: bool):
+        self._name = var_key + _NodeDB._NAME
+        self._node = VarDB(f'{self._name}_packed', db, bytes)
+        self._legacy = _NodeDB(var_key, db, value_type) if fallback else None
+        self._value_type = value_type
+        self._loaded = False
+        self._from_legacy = False
+        self._exists = False
+        self._value = Codec.default(value_type)
+        self._next = 0
+        self._prev = 0
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+
+        self._loaded = True
+        data = self._node.get()
+
+        if data is not None:
+            self._exists = True
+            self._decode(data)
+
+        elif self._legacy and self._legacy.exists():
+            self._exists = True
+            self._from_legacy = True
+            self._load_legacy()
+
+    def _decode(self, data: bytes) -> None:
+        self._prev, self._next, self._value = Codec.decode(data, [int, int, self._value_type])
+
+    def _encode(self) -> bytes:
+        return Codec.encode([self._prev, self._next, self._value], [int, int, self._value_type])
+
+    def _load_legacy(self) -> None:
+        self._prev = self._legacy.get_prev()
+        self._next = self._legacy.get_next()
+        self._value = self._legacy.get_value()
+
+    def delete(self) -> None:
+        self._load()
+        self._node.remove()
+        if self._from_legacy:
+            self._legacy.delete()
+            self._from_legacy = False
+        self._exists = False
+
+    def save(self) -> None:
+        self._load()
+        self._node.set(self._encode())
+        if self._from_legacy:
+            self._legacy.delete()
+            self._from_legacy = False
+        self._exists = True
+
+    def is_legacy(self) -> bool:
+        self._load()
+        return self._from_legacy
+
+    def exists(self) -> bool:
+        self._load()
+        return self._exists
+
+    def get_value(self):
+        self._load()
+        return self._value
+
+    def set_value(self, value) -> None:
+        self._load()
+        self._value = value
+
+    def get_next(self) -> int:
+        self._load()
+        return self._next
+
+    def set_next(self, next_id: int) -> None:
+        self._load()
+        self._next = next_id
+
+    def get_prev(self) -> int:
+        self._load()
+        return self._prev
+
+    def set_prev(self, prev_id: int) -> None:
+        self._load()
+        self._prev = prev_id
+
+
+class _UIDNodeDB(_PackedNodeDB):
+    # UIDNodeDB is an item of the UIDLinkedListDB
+    # Its structure is internal and shouldn't be manipulated outside of this module
+    # The value of the node is always equal to its node id, so only the links are stored.
+    # The node exists as long as its links are stored.
+
+    def __init__(self, node_id: int, var_key: str, db: IconScoreDatabase, fallback: bool):
+        super().__init__(var_key, db, int, fallback)
+        self._value = node_id
+
+    def _decode(self, data: bytes) -> None:
+        self._prev, self._next = Codec.decode(data, [int, int])
+
+    def _encode(self) -> bytes:
+        return Codec.encode([self._prev, self._next], [int, int])
+
+    def _load_legacy(self) -> None:
+        self._prev = self._legacy.get_prev()
+        self._next = self._legacy.get_next()
+
+    def set_value(self, value: int) -> None:
+        # The value is the node id
+        pass
+
+
+class _LinkedListHeader:
+    # LinkedListHeader holds the head, the tail and the length of a LinkedListDB
+    # Its structure is internal and shouldn't be manipulated outside of this module
+
+    _FIELDS = [int, int, int, int, int]
+
+    def __init__(self, head_id: int = 0, tail_id: int = 0, length: int = 0, migration_id: int = 0, epoch: int = 0):
+        self.head_id = head_id
+        self.tail_id = tail_id
+        self.length = length
+        # In packed mode, the first node that may still be stored with the legacy layout.
+        # All the nodes before it have been migrated. 0 if there isn't any legacy node left.
+        self.migration_id = migration_id
+        # In packed mode, the namespace of the nodes, incremented each time the linkedlist is cleared
+        self.epoch = epoch
+        # Values stored in the legacy slots, so only the modified ones are written
+        self.legacy = (0, 0, 0)
+
+    def serialize(self) -> list:
+        return [self.head_id, self.tail_id, self.length, self.migration_id, self.epoch]
+
+
+class _LinkedListIndex:
+    # LinkedListIndex is an order-statistic skip list over the nodes of a LinkedListDB,
+    # so the node at a given position is found with O(log n) reads instead of walking the list.
+    # Its structure is internal and shouldn't be manipulated outside of this module
+    # The level of a node is derived from its node id : a node has a level >= L with a probability of 1/4^L.
+    # Only the nodes with a level >= 1 have an index entry, holding for each of their levels
+    # the next node, the distance to the next node and the previous node at this level.
+    # The index header holds for each level the first node, its distance from the start of the list,
+    # the last node and the distance from the last node to the end of the list.
+    # Both the start and the end of the list are designated by the node id 0.
+    # An index added to an existing linkedlist is built from the head : only the nodes
+    # before the build cursor are indexed, and the index is only used once it is complete.
+
+    _NAME = '_INDEX'
+    _MAX_LEVEL = 12
+    # Amount of non-indexed nodes added to the index each time the linkedlist is modified
+    _BUILD_STEP = 2
+
+    # Fields of a level
+    _NEXT = 0
+    _WIDTH = 1
+    _PREV = 2
+    _GAP = 3
+
+    def __init__(self, linkedlist, var_key: str, db: IconScoreDatabase):
+        self._list = linkedlist
+        self._name = var_key + _LinkedListIndex._NAME
+        self._db = db
+        # Loaded entries, only valid during a single operation on the linkedlist
+        self._entries = None
+        self._dirty = set()
+        self._count = 0
+        self._pending_id = 0
+        self._epoch = 0
+
+    @staticmethod
+    def _level(node_id: int) -> int:
+        # Fibonacci hashing spreads consecutive node ids evenly
+        digest = (node_id * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        level = 0
+        while level < _LinkedListIndex._MAX_LEVEL and digest < (1 << (62 - 2 * level)):
+            level += 1
+        return level
+
+    def _epoch_name(self, epoch: int) -> str:
+        return f'{self._name}_{epoch}' if epoch else self._name
+
+    def _header_db(self, epoch: int) -> VarDB:
+        return VarDB(self._epoch_name(epoch), self._db, bytes)
+
+    def _entry_db(self, node_id: int, epoch: int = None) -> VarDB:
+        return VarDB(str(node_id) + self._epoch_name(self._epoch if epoch is None else epoch), self._db, bytes)
+
+    def _load(self, header: _LinkedListHeader) -> None:
+        if self._entries is not None:
+            return
+
+        self._entries = {}
+        self._dirty = set()
+        self._epoch = header.epoch
+        data = self._header_db(self._epoch).get()
+
+        if data is None:
+            # The index has never been used, all the existing nodes need to be indexed
+            self._count = 0
+            self._pending_id = header.head_id
+            self._entries[0] = [[0, 0, 0, 0] for _ in range(_LinkedListIndex._MAX_LEVEL)]
+            self._dirty.add(0)
+            return
+
+        fields = Codec.decode(data, [int] * (2 + 4 * _LinkedListIndex._MAX_LEVEL))
+        self._pending_id, self._count = fields[0:2]
+        self._entries[0] = self._split_levels(fields[2:], 4)
+
+        for level in self._entries[0]:
+            if not level[_LinkedListIndex._NEXT]:
+                # Empty level : the distance from the start to the end of the list
+                level[_LinkedListIndex._GAP] = self._count
+
+    @staticmethod
+    def _split_levels(fields: list, size: int) -> list:
+        return [fields[i:i + size] for i in range(0, len(fields), size)]
+
+    def _encode_header(self) -> bytes:
+        levels = self._entries[0]
+        # Empty levels at the top are implied
+        top = len(levels)
+        while top and not levels[top - 1][_LinkedListIndex._NEXT]:
+            top -= 1
+        fields = [self._pending_id, self._count]
+        for level in levels[:top]:
+            fields += level
+        return Codec.encode(fields, [int] * len(fields))
+
+    def _entry(self, node_id: int) -> list:
+        # Levels of a node entry, or of the index header for the node id 0
+        # None if the node isn't indexed
+        if node_id not in self._entries:
+            data = self._entry_db(node_id).get()
+            if data is not None:
+                level = self._level(node_id)
+                self._entries[node_id] = self._split_levels(Codec.decode(data, [int] * (3 * level)), 3)
+            else:
+                self._entries[node_id] = None
+        return self._entries[node_id]
+
+    def _get_next(self, node_id: int, level: int) -> int:
+        return self._entry(node_id)[level - 1][_LinkedListIndex._NEXT]
+
+    def _set_next(self, node_id: int, level: int, next_id: int) -> None:
+        self._entry(node_id)[level - 1][_LinkedListIndex._NEXT] = next_id
+        self._dirty.add(node_id)
+
+    def _get_width(self, node_id: int, level: int) -> int:
+        # Distance to the next node at this level, or to the end of the list for the last node
+        if self._get_next(node_id, level):
+            return self._entry(node_id)[level - 1][_LinkedListIndex._WIDTH]
+        return self._entry(0)[level - 1][_LinkedListIndex._GAP]
+
+    def _set_width(self, node_id: int, level: int, width: int) -> None:
+        if self._get_next(node_id, level):
+            self._entry(node_id)[level - 1][_LinkedListIndex._WIDTH] = width
+            self._dirty.add(node_id)
+        else:
+            self._entry(0)[level - 1][_LinkedListIndex._GAP] = width
+            self._dirty.add(0)
+
+    def _get_prev(self, node_id: int, level: int) -> int:
+        # The previous node of the end of the list is the last node at this level
+        return self._entry(node_id)[level - 1][_LinkedListIndex._PREV]
+
+    def _set_prev(self, node_id: int, level: int, prev_id: int) -> None:
+        self._entry(node_id)[level - 1][_LinkedListIndex._PREV] = prev_id
+        self._dirty.add(node_id)
+
+    def _walk_back(self, header: _LinkedListHeader, cur_id: int, distance: int, level: int, cur=None) -> list:
+        # Find the nearest node at or before a given node for each level above a given level,
+        # along with the distance between that node and the position following the given node
+        result = []
+
+        for cur_level in range(level, _LinkedListIndex._MAX_LEVEL + 1):
+            while cur_id and self._level(cur_id) < cur_level:
+                if cur_level == 1:
+                    cur = cur or self._list._get_node(cur_id)
+                    cur_id = self._list._get_prev_id(header, cur_id, cur)
+                    distance += 1
+                    cur = None
+                else:
+                    cur_id = self._get_prev(cur_id, cur_level - 1)
+                    distance += self._get_width(cur_id, cur_level - 1)
+            result.append((cur_id, distance))
+
+        return result
+
+    def _contains(self, header: _LinkedListHeader, node_id: int) -> bool:
+        # While the index is built, the indexed nodes are the ones before the build cursor
+        if node_id == self._pending_id:
+            return False
+
+        while node_id:
+            if node_id == self._pending_id:
+                return True
+            if self._level(node_id):
+                return self._entry(node_id) is not None
+            node_id = self._list._get_next_id(header, node_id, self._list._get_node(node_id))
+        return not self._pending_id
+
+    def _insert(self, cur_id: int, predecessors: list) -> None:
+        level = self._level(cur_id)
+        if level:
+            self._entries[cur_id] = [[0, 0, 0] for _ in range(level)]
+
+        for cur_level, (prev_id, distance) in enumerate(predecessors, 1):
+            width = self._get_width(prev_id, cur_level)
+
+            if cur_level <= level:
+                next_id = self._get_next(prev_id, cur_level)
+                self._set_next(prev_id, cur_level, cur_id)
+                self._set_width(prev_id, cur_level, distance)
+                self._set_next(cur_id, cur_level, next_id)
+                self._set_width(cur_id, cur_level, width - distance + 1)
+                self._set_prev(cur_id, cur_level, prev_id)
+                self._set_prev(next_id, cur_level, cur_id)
+            else:
+                self._set_width(prev_id, cur_level, width + 1)
+
+        self._count += 1
+        self._dirty.add(0)
+
+    def _append(self, cur_id: int) -> None:
+        # Insert a node after the last indexed node, no need to look for its predecessors
+        levels = self._entry(0)
+        self._insert(cur_id, [
+            (fields[_LinkedListIndex._PREV], fields[_LinkedListIndex._GAP] + 1)
+            for fields in levels
+        ])
+
+    def insert(self, header: _LinkedListHeader, cur_id: int, prev_id: int, next_id: int, prev_node=None) -> None:
+        # Called before a node is linked between two nodes
+        self._load(header)
+
+        if next_id == self._pending_id:
+            # Inserted at the end of the indexed nodes
+            self._append(cur_id)
+        elif self._pending_id and not (next_id and self._contains(header, next_id)):
+            # The node isn't in the indexed part of the list
+            pass
+        else:
+            self._insert(cur_id, self._walk_back(header, prev_id, 1, 1, prev_node))
+
+    def remove(self, header: _LinkedListHeader, cur_id: int, cur) -> None:
+        # Called before a node is unlinked from its neighbours
+        self._load(header)
+
+        if cur_id == self._pending_id:
+            # The build cursor moves to the next node
+            self._pending_id = self._list._get_next_id(header, cur_id, cur)
+            self._dirty.add(0)
+            return
+
+        if self._pending_id and not self._contains(header, cur_id):
+            return
+
+        level = self._level(cur_id)
+
+        for cur_level in range(1, level + 1):
+            prev_id = self._get_prev(cur_id, cur_level)
+            next_id = self._get_next(cur_id, cur_level)
+            width = self._get_width(prev_id, cur_level) + self._get_width(cur_id, cur_level) - 1
+            self._set_next(prev_id, cur_level, next_id)
+            self._set_width(prev_id, cur_level, width)
+            self._set_prev(next_id, cur_level, prev_id)
+
+        if level:
+            start_id = self._get_prev(cur_id, level)
+            self._entries[cur_id] = None
+            self._dirty.add(cur_id)
+        else:
+            start_id = self._list._get_prev_id(header, cur_id, cur)
+
+        for cur_level, (prev_id, _) in enumerate(self._walk_back(header, start_id, 0, level + 1), level + 1):
+            self._set_width(prev_id, cur_level, self._get_width(prev_id, cur_level) - 1)
+
+        self._count -= 1
+        self._dirty.add(0)
+
+    def build(self, header: _LinkedListHeader, max_count: int) -> bool:
+        # Index a limited amount of the existing nodes
+        # Returns True if all the nodes are indexed
+        self._load(header)
+
+        for _ in range(max_count):
+            cur_id = self._pending_id
+            if not cur_id:
+                break
+            self._append(cur_id)
+            self._pending_id = self._list._get_next_id(header, cur_id, self._list._get_node(cur_id))
+
+        return self._pending_id == 0
+
+    def is_complete(self, header: _LinkedListHeader) -> bool:
+        # Returns True if all the nodes are indexed, without loading the index
+        data = self._header_db(header.epoch).get()
+        if data is None:
+            return header.head_id == 0
+        return Codec.decode(data, [int] * (2 + 4 * _LinkedListIndex._MAX_LEVEL))[0] == 0
+
+    def seek(self, header: _LinkedListHeader, offset: int) -> int:
+        # Returns the node id at a given position, 0 if the position is the end of the list
+        # Returns None if the index isn't complete yet
+        loaded = self._entries is not None
+        self._load(header)
+
+        try:
+            if self._pending_id:
+                return None
+
+            position = 0
+            cur_id = 0
+
+            for level in range(_LinkedListIndex._MAX_LEVEL, 0, -1):
+                next_id = self._get_next(cur_id, level)
+                while next_id and position + self._get_width(cur_id, level) <= offset + 1:
+                    position += self._get_width(cur_id, level)
+                    cur_id = next_id
+                    next_id = self._get_next(cur_id, level)
+
+            while position < offset + 1 and position < self._count:
+                cur_id = self._list._get_next_id(header, cur_id, self._list._get_node(cur_id)) if cur_id else header.head_id
+                position += 1
+
+            return cur_id if position == offset + 1 else 0
+
+        finally:
+            if not loaded:
+                self._entries = None
+
+    def save(self, header: _LinkedListHeader) -> None:
+        if self._entries is None:
+            # Not used during this operation
+            return
+
+        if self._pending_id:
+            self.build(header, _LinkedListIndex._BUILD_STEP)
+
+        for node_id in self._dirty:
+            if node_id == 0:
+                self._header_db(self._epoch).set(self._encode_header())
+            elif self._entries[node_id] is None:
+                self._entry_db(node_id).remove()
+            else:
+                fields = []
+                for level in self._entries[node_id]:
+                    fields += level
+                self._entry_db(node_id).set(Codec.encode(fields, [int] * len(fields)))
+
+        self._entries = None
+
+    def delete_entry(self, node_id: int, epoch: int) -> None:
+        # Called when the nodes of the linkedlist are deleted
+        if self._level(node_id):
+            self._entry_db(node_id, epoch).remove()
+
+    def delete(self, epoch: int) -> None:
+        self._header_db(epoch).remove()
+        self._entries = None
+
+
 class LinkedListDB:
     # LinkedListDB is an iterable collection of items double linked by unique IDs.
     # Order of retrieval is preserved.
     # Circular linked listing or duplicates nodes in the same linkedlist is *not allowed*
     # in order to prevent infinite loops.
+    # In packed mode, the value and the links of a node are stored in a single slot,
+    # and so are the head, the tail and the length of the linkedlist.
+    # A linkedlist created with the legacy layout may switch to the packed mode :
+    # legacy nodes are migrated when they're modified, or using the migrate method.
+    # An indexed linkedlist maintains a skip list over its nodes, so selecting items
+    # from a given offset doesn't require to iterate over all the previous items.
+    # In packed mode, clearing the linkedlist moves it to a new epoch namespace in constant time :
+    # the nodes of the previous epochs are unreachable, and may be deleted later using the purge method.
 
     _NAME = '_LINKED_LISTDB'
 
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, packed: bool = False, indexed: bool = False):
         self._name = var_key + LinkedListDB._NAME
         self._head_id = VarDB(f'{self._name}_head_id', db, int)
         self._tail_id = VarDB(f'{self._name}_tail_id', db, int)
         self._length = VarDB(f'{self._name}_length', db, int)
+        self._header = VarDB(f'{self._name}_header', db, bytes)
         self._value_type = value_type
+        self._packed = packed
+        # Unknown until the header is read
+        self._fallback = None if packed else False
+        self._epoch = 0
+        self._index = _LinkedListIndex(self, self._name, db) if indexed else None
         self._db = db
 
     def delete(self) -> None:
+        # Packed nodes are deleted by a single bounded purge step : if some nodes are left,
+        # the empty list header is kept so its epoch isn't reused. The remaining nodes
+        # are deleted by calling purge until it returns True, then delete removes the header
         self.clear()
+        if self._packed:
+            if self._index:
+                self._index.delete(self._epoch)
+            if not self.purge():
+                return
         self._head_id.remove()
         self._tail_id.remove()
         self._length.remove()
+        self._header.remove()
 
     def __len__(self) -> int:
-        return self._length.get()
+        if not self._packed:
+            return self._length.get()
+        return self._get_header().length
 
     def __iter__(self):
-        cur_id = self._head_id.get()
+        # Iterate from the head to the tail
+        return self._iterate(False)
 
-        # Empty linked list
-        if not cur_id:
-            return iter(())
+    def __reversed__(self):
+        # Iterate from the tail to the head
+        return self._iterate(True)
 
-        node = self._get_node(cur_id)
-        yield (cur_id, node.get_value())
-        tail_id = self._tail_id.get()
+    def _iterate(self, reverse: bool):
+        # The header is only read once
+        header = self._get_header()
+        cur_id = header.tail_id if reverse else header.head_id
 
-        # Iterate until tail
-        while cur_id != tail_id:
-            cur_id = node.get_next()
+        while cur_id:
             node = self._get_node(cur_id)
-            yield (cur_id, node.get_value())
-            tail_id = self._tail_id.get()
+            item = self._node_item(cur_id, node)
+            # Read the adjacent node id before yielding, so the current node may be removed by the caller
+            cur_id = self._get_adjacent_id(header, cur_id, node, reverse)
+            yield item
+
+    def _get_header(self) -> _LinkedListHeader:
+        if self._packed:
+            data = self._header.get()
+            if data is not None:
+                header = _LinkedListHeader(*Codec.decode(data, _LinkedListHeader._FIELDS))
+                self._fallback = header.migration_id != 0
+                self._epoch = header.epoch
+                return header
+
+        header = _LinkedListHeader(self._head_id.get(), self._tail_id.get(), self._length.get())
+        header.legacy = (header.head_id, header.tail_id, header.length)
+
+        if self._packed:
+            # The linkedlist has been created with the legacy layout,
+            # its nodes are migrated starting from the head
+            header.migration_id = header.head_id
+            self._fallback = header.migration_id != 0
+
+        return header
+
+    def _save_header(self, header: _LinkedListHeader) -> None:
+        head_id, tail_id, length = header.legacy
+
+        if self._packed:
+            self._header.set(Codec.encode(header.serialize(), _LinkedListHeader._FIELDS))
+            if head_id:
+                # The legacy header has been migrated
+                self._head_id.remove()
+                self._tail_id.remove()
+                self._length.remove()
+            self._fallback = header.migration_id != 0
+            self._epoch = header.epoch
+
+        else:
+            if header.head_id != head_id:
+                if header.head_id:
+                    self._head_id.set(header.head_id)
+                else:
+                    self._head_id.remove()
+            if header.tail_id != tail_id:
+                if header.tail_id:
+                    self._tail_id.set(header.tail_id)
+                else:
+                    self._tail_id.remove()
+            if header.length != length:
+                self._length.set(header.length)
+
+        header.legacy = (0, 0, 0) if self._packed else (header.head_id, header.tail_id, header.length)
 
-    def _node(self, node_id) -> _NodeDB:
-        return _NodeDB(str(node_id) + self._name, self._db, self._value_type)
+        if self._index:
+            self._index.save(header)
+
+    def _has_legacy_nodes(self) -> bool:
+        if self._fallback is None:
+            # Find out if there are still some legacy nodes
+            self._get_header()
+        return self._fallback
+
+    def _node_key(self, node_id: int, epoch: int) -> str:
+        return f'{node_id}{self._name}_{epoch}' if epoch else str(node_id) + self._name
+
+    def _node(self, node_id):
+        if not self._packed:
+            return _NodeDB(str(node_id) + self._name, self._db, self._value_type)
+
+        fallback = self._has_legacy_nodes()
+        return self._packed_node(node_id, self._epoch, fallback)
+
+    def _packed_node(self, node_id: int, epoch: int, fallback: bool):
+        return _PackedNodeDB(self._node_key(node_id, epoch), self._db, self._value_type, fallback)
 
     def _create_node(self, value, node_id: int = None) -> tuple:
         if node_id is None:
@@ -142,348 +717,442 @@ class LinkedListDB:
         node.set_value(value)
         return (node_id, node)
 
-    def _get_node(self, node_id: int) -> _NodeDB:
+    def _get_node(self, node_id: int):
         node = self._node(node_id)
         if not node.exists():
             raise LinkedNodeNotFound(self._name, node_id)
         return node
 
-    def _get_tail_node(self) -> _NodeDB:
-        tail_id = self._tail_id.get()
-        if not tail_id:
-            raise EmptyLinkedListException(self._name)
-        return self._get_node(tail_id)
+    def _get_next_id(self, header: _LinkedListHeader, cur_id: int, cur) -> int:
+        # The tail may have an outdated next node id
+        return cur.get_next() if cur_id != header.tail_id else 0
+
+    def _get_prev_id(self, header: _LinkedListHeader, cur_id: int, cur) -> int:
+        # The head may have an outdated previous node id
+        return cur.get_prev() if cur_id != header.head_id else 0
+
+    def _get_adjacent_id(self, header: _LinkedListHeader, cur_id: int, cur, reverse: bool) -> int:
+        if reverse:
+            return self._get_prev_id(header, cur_id, cur)
+        return self._get_next_id(header, cur_id, cur)
+
+    def _link(self, header: _LinkedListHeader, cur_id: int, cur, prev_id: int, next_id: int, prev_node=None, next_node=None) -> None:
+        # Insert a node between two nodes (0 for the boundaries of the linkedlist)
+        # Already loaded neighbour nodes may be provided in order to prevent reading them again
+        if self._index:
+            self._index.insert(header, cur_id, prev_id, next_id, prev_node)
+
+        if prev_id:
+            prev_node = prev_node or self._get_node(prev_id)
+            prev_node.set_next(cur_id)
+            prev_node.save()
+        else:
+            header.head_id = cur_id
 
-    def _get_head_node(self) -> _NodeDB:
-        head_id = self._head_id.get()
-        if not head_id:
-            raise EmptyLinkedListException(self._name)
-        return self._get_node(head_id)
+        if next_id:
+            next_node = next_node or self._get_node(next_id)
+            next_node.set_prev(cur_id)
+            next_node.save()
+        else:
+            header.tail_id = cur_id
+
+        cur.set_prev(prev_id)
+        cur.set_next(next_id)
+        cur.save()
+
+    def _unlink(self, header: _LinkedListHeader, cur_id: int, cur) -> None:
+        # Detach a node from its neighbours, the detached node itself isn't modified
+        if self._index:
+            self._index.remove(header, cur_id, cur)
+
+        prev_id = self._get_prev_id(header, cur_id, cur)
+        next_id = self._get_next_id(header, cur_id, cur)
+
+        if header.migration_id == cur_id:
+            # All the nodes before the node being detached have already been migrated
+            header.migration_id = next_id
+
+        if prev_id:
+            prev_node = self._get_node(prev_id)
+            prev_node.set_next(next_id)
+            prev_node.save()
+        else:
+            header.head_id = next_id
+
+        if next_id:
+            next_node = self._get_node(next_id)
+            next_node.set_prev(prev_id)
+            next_node.save()
+        else:
+            header.tail_id = prev_id
 
     def node_value(self, cur_id: int):
-        # Returns the value of a given node id 
+        # Returns the value of a given node id
         return self._get_node(cur_id).get_value()
 
     def head_value(self):
-        # Returns the value of the head of the linkedlist 
-        return self.node_value(self._head_id.get())
+        # Returns the value of the head of the linkedlist
+        return self.node_value(self._get_header().head_id)
 
     def tail_value(self):
-        # Returns the value of the tail of the linkedlist 
-        return self.node_value(self._tail_id.get())
+        # Returns the value of the tail of the linkedlist
+        return self.node_value(self._get_header().tail_id)
 
     def next(self, cur_id: int) -> int:
         # Get the next node id from a given node
-        # Raises ScorelibStopIteration if it doesn't exist 
+        # Raises ScorelibStopIteration if it doesn't exist
         node = self._get_node(cur_id)
-        next_id = node.get_next()
+        next_id = self._get_next_id(self._get_header(), cur_id, node)
         if not next_id:
             raise ScorelibStopIteration(self._name)
         return next_id
 
     def prev(self, cur_id: int) -> int:
         # Get the next node id from a given node
-        # Raises ScorelibStopIteration if it doesn't exist 
+        # Raises ScorelibStopIteration if it doesn't exist
         node = self._get_node(cur_id)
-        prev_id = node.get_prev()
+        prev_id = self._get_prev_id(self._get_header(), cur_id, node)
         if not prev_id:
             raise ScorelibStopIteration(self._name)
         return prev_id
 
+    def build_index(self, max_count: int = MAX_ITERATION_LOOP) -> bool:
+        # Add a limited amount of the existing nodes to the index
+        # The index is also built progressively as the linkedlist is modified
+        # Returns True if the index is complete
+        header = self._get_header()
+        complete = self._index.build(header, max_count)
+        self._index.save(header)
+        return complete
+
+    def is_indexed(self) -> bool:
+        # Returns True if the index is complete and used by select and node_id_at
+        return self._index.is_complete(self._get_header())
+
+    def node_id_at(self, offset: int) -> int:
+        # Returns the node id at a given position of the linkedlist
+        # Raises ScorelibStopIteration if it doesn't exist
+        header = self._get_header()
+        if offset < 0 or offset >= header.length:
+            raise ScorelibStopIteration(self._name)
+
+        cur_id = self._index.seek(header, offset) if self._index else None
+        if cur_id is None:
+            cur_id = header.head_id
+            for _ in range(offset):
+                cur_id = self._get_next_id(header, cur_id, self._get_node(cur_id))
+
+        return cur_id
+
+    def is_migrated(self) -> bool:
+        # Returns True if there isn't any legacy node left to migrate
+        return self._get_header().migration_id == 0
+
+    def migrate(self, max_count: int = MAX_ITERATION_LOOP) -> bool:
+        # Migrate a limited amount of legacy nodes to the packed layout
+        # Returns True if the whole linkedlist has been migrated
+        header = self._get_header()
+        cur_id = header.migration_id
+        if not cur_id:
+            # Nothing to migrate, don't rewrite the header
+            return True
+
+        for _ in range(max_count):
+            if not cur_id:
+                break
+
+            node = self._get_node(cur_id)
+            next_id = self._get_next_id(header, cur_id, node)
+            if node.is_legacy():
+                node.save()
+            cur_id = next_id
+
+        header.migration_id = cur_id
+        self._save_header(header)
+        return cur_id == 0
+
     def clear(self) -> None:
-        # Delete all nodes from the linkedlist 
-        cur_id = self._head_id.get()
+        # Delete all nodes from the linkedlist
+        header = self._get_header()
+
+        if self._packed:
+            if not header.head_id:
+                # Empty list
+                return
+
+            # Keep track of the previous epoch, so its nodes can be purged later
+            self._garbage().put(Codec.encode([header.epoch, header.head_id, header.tail_id, header.migration_id], [int] * 4))
+            cleared = _LinkedListHeader(epoch=header.epoch + 1)
+            cleared.legacy = header.legacy
+            self._save_header(cleared)
+            return
+
+        if self._index:
+            self._index.delete(header.epoch)
+
+        cur_id = header.head_id
         if not cur_id:
             # Empty list
             return
 
         node = self._get_node(cur_id)
-        tail_id = self._tail_id.get()
 
         # Iterate until tail
-        while cur_id != tail_id:
-            cur_id = node.get_next()
+        while cur_id != header.tail_id:
+            next_id = node.get_next()
             # We're done with this node
-            node.delete()
+            self._delete_node(cur_id, node)
             # Iterate to the next node
+            cur_id = next_id
             node = self._get_node(cur_id)
 
         # Delete the last node
-        node.delete()
-
-        self._tail_id.remove()
-        self._head_id.remove()
-        self._length.set(0)
+        self._delete_node(cur_id, node)
+
+        header.head_id = 0
+        header.tail_id = 0
+        header.length = 0
+        self._save_header(header)
+
+    def _delete_node(self, cur_id: int, cur, epoch: int = 0) -> None:
+        if self._index:
+            self._index.delete_entry(cur_id, epoch)
+        cur.delete()
+
+    def _garbage(self) -> ArrayDB:
+        # Epochs left by the clear operations that still contain some nodes
+        return ArrayDB(f'{self._name}_garbage', self._db, bytes)
+
+    def purge(self, max_count: int = MAX_ITERATION_LOOP) -> bool:
+        # Delete a limited amount of the nodes left by the previous clear operations
+        # Returns True if there isn't any node left to delete
+        garbage = self._garbage()
+        count = 0
+
+        while len(garbage) and count < max_count:
+            last = len(garbage) - 1
+            epoch, cur_id, tail_id, migration_id = Codec.decode(garbage[last], [int] * 4)
+
+            while cur_id and count < max_count:
+                node = self._packed_node(cur_id, epoch, migration_id != 0)
+                next_id = node.get_next() if cur_id != tail_id else 0
+                self._delete_node(cur_id, node, epoch)
+                cur_id = next_id
+                count += 1
+
+            if cur_id:
+                garbage[last] = Codec.encode([epoch, cur_id, tail_id, migration_id], [int] * 4)
+            else:
+                if self._index:
+                    self._index.delete(epoch)
+                garbage.pop()
+
+        return len(garbage) == 0
 
     def append(self, value, node_id: int = None) -> int:
-        # Append an element at the end of the linkedlist 
+        # Append an element at the end of the linkedlist
+        header = self._get_header()
         cur_id, cur = self._create_node(value, node_id)
+        self._link(header, cur_id, cur, header.tail_id, 0)
+        header.length += 1
+        self._save_header(header)
+        return cur_id
 
-        if self._length.get() == 0:
-            # Empty LinkedList
-            self._head_id.set(cur_id)
-            self._tail_id.set(cur_id)
-        else:
-            # Append to tail
-            tail = self._get_tail_node()
-            tail.set_next(cur_id)
-            cur.set_prev(self._tail_id.get())
-            # Update tail to cur node
-            self._tail_id.set(cur_id)
+    def extend(self, values: list, node_ids: list = None) -> list:
+        # Append multiple elements at the end of the linkedlist
+        # The header is only written once, and each node is only written once
+        header = self._get_header()
+        prev_id = header.tail_id
+        prev = self._get_node(prev_id) if prev_id else None
+        result = []
 
-        self._length.set(self._length.get() + 1)
+        for index, value in enumerate(values):
+            cur_id, cur = self._create_node(value, node_ids[index] if node_ids else None)
+            if cur_id in result:
+                raise LinkedNodeAlreadyExists(self._name, cur_id)
 
-        return cur_id
+            if self._index:
+                self._index.insert(header, cur_id, prev_id, 0, prev)
 
-    def prepend(self, value, node_id: int = None) -> int:
-        # Prepend an element at the beginning of the linkedlist 
-        cur_id, cur = self._create_node(value, node_id)
+            if prev:
+                prev.set_next(cur_id)
+                prev.save()
+            else:
+                header.head_id = cur_id
 
-        if self._length.get() == 0:
-            # Empty LinkedList
-            self._head_id.set(cur_id)
-            self._tail_id.set(cur_id)
-        else:
-            # Prepend to head
-            head = self._get_head_node()
-            head.set_prev(cur_id)
-            cur.set_next(self._head_id.get())
-            # Update head to cur node
-            self._head_id.set(cur_id)
+            cur.set_prev(prev_id)
+            cur.set_next(0)
+            header.tail_id = cur_id
+            header.length += 1
+            result.append(cur_id)
+            prev_id, prev = cur_id, cur
+
+        if result:
+            prev.save()
+            self._save_header(header)
 
-        self._length.set(self._length.get() + 1)
+        return result
 
+    def prepend(self, value, node_id: int = None) -> int:
+        # Prepend an element at the beginning of the linkedlist
+        header = self._get_header()
+        cur_id, cur = self._create_node(value, node_id)
+        self._link(header, cur_id, cur, 0, header.head_id)
+        header.length += 1
+        self._save_header(header)
         return cur_id
 
     def append_after(self, value, after_id: int, node_id: int = None) -> int:
-        # Append an element after an existing item of the linkedlist 
-        if after_id == self._tail_id.get():
+        # Append an element after an existing item of the linkedlist
+        header = self._get_header()
+        if after_id == header.tail_id:
             return self.append(value, node_id)
 
         after = self._get_node(after_id)
         cur_id, cur = self._create_node(value, node_id)
-
-        afternext_id = after.get_next()
-        afternext = self._get_node(afternext_id)
-
-        # after>nid
-        after.set_next(cur_id)
-        # after>next>pid
-        afternext.set_prev(cur_id)
-        # cur>nid
-        cur.set_next(afternext_id)
-        # cur>pid
-        cur.set_prev(after_id)
-
-        self._length.set(self._length.get() + 1)
+        self._link(header, cur_id, cur, after_id, after.get_next(), prev_node=after)
+        header.length += 1
+        self._save_header(header)
         return cur_id
 
     def prepend_before(self, value, before_id: int, node_id: int = None) -> int:
-        # Append an element before an existing item of the linkedlist 
-        if before_id == self._head_id.get():
+        # Append an element before an existing item of the linkedlist
+        header = self._get_header()
+        if before_id == header.head_id:
             return self.prepend(value, node_id)
 
         before = self._get_node(before_id)
         cur_id, cur = self._create_node(value, node_id)
-
-        beforeprev_id = before.get_prev()
-        beforeprev = self._get_node(beforeprev_id)
-
-        # before>pid
-        before.set_prev(cur_id)
-        # before>prev>nid
-        beforeprev.set_next(cur_id)
-        # cur>nid
-        cur.set_next(before_id)
-        # cur>pid
-        cur.set_prev(beforeprev_id)
-
-        self._length.set(self._length.get() + 1)
+        self._link(header, cur_id, cur, before.get_prev(), before_id, next_node=before)
+        header.length += 1
+        self._save_header(header)
         return cur_id
 
     def move_node_after(self, cur_id: int, after_id: int) -> None:
-        # Move an existing node after another existing node 
+        # Move an existing node after another existing node
         if cur_id == after_id:
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
-        if after_id == self._tail_id.get():
+        header = self._get_header()
+        if after_id == header.tail_id:
             return self.move_node_tail(cur_id)
 
         cur = self._get_node(cur_id)
 
-        if after_id == cur.get_prev():
+        if after_id == self._get_prev_id(header, cur_id, cur):
             # noop
             return
 
         after = self._get_node(after_id)
-        afternext_id = after.get_next()
-        afternext = self._get_node(afternext_id)
-        curprev_id = cur.get_prev()
-        if curprev_id:  # cur may be the head
-            curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        if curnext_id:  # cur may be the tail
-            curnext = self._get_node(curnext_id)
-
-        # after>nid
-        after.set_next(cur_id)
-        # after>next>pid
-        afternext.set_prev(cur_id)
-        # curprev>nid
-        if curprev_id:
-            curprev.set_next(curnext_id)
-        else:
-            # cur was head, set new head
-            self._head_id.set(curnext_id)
-        # curnext>pid
-        if curnext_id:
-            curnext.set_prev(curprev_id)
-        else:
-            # cur was tail, set new tail
-            self._tail_id.set(curprev_id)
-        # cur>nid
-        cur.set_next(afternext_id)
-        # cur>pid
-        cur.set_prev(after_id)
+        curnext_id = self._get_next_id(header, cur_id, cur)
+        self._unlink(header, cur_id, cur)
+
+        if after_id == curnext_id:
+            # The after node has been modified during the unlink
+            after = self._get_node(after_id)
+
+        self._link(header, cur_id, cur, after_id, after.get_next(), prev_node=after)
+        self._save_header(header)
 
     def move_node_before(self, cur_id: int, before_id: int) -> None:
-        # Move an existing node before another existing node 
+        # Move an existing node before another existing node
         if cur_id == before_id:
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
-        if before_id == self._head_id.get():
+        header = self._get_header()
+        if before_id == header.head_id:
             return self.move_node_head(cur_id)
 
         cur = self._get_node(cur_id)
 
-        if before_id == cur.get_next():
+        if before_id == self._get_next_id(header, cur_id, cur):
             # noop
             return
 
         before = self._get_node(before_id)
-        beforeprev_id = before.get_prev()
-        beforeprev = self._get_node(beforeprev_id)
-        curprev_id = cur.get_prev()
-        if curprev_id:  # cur may be the head
-            curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        if curnext_id:  # cur may be the tail
-            curnext = self._get_node(curnext_id)
-
-        # before>pid
-        before.set_prev(cur_id)
-        # before>prev>nid
-        beforeprev.set_next(cur_id)
-        # curprev>nid
-        if curprev_id:
-            curprev.set_next(curnext_id)
-        else:
-            # cur was head, set new head
-            self._head_id.set(curnext_id)
-        # curnext>pid
-        if curnext_id:
-            curnext.set_prev(curprev_id)
-        else:
-            # cur was tail, set new tail
-            self._tail_id.set(curprev_id)
-        # cur>nid
-        cur.set_next(before_id)
-        # cur>pid
-        cur.set_prev(beforeprev_id)
+        curprev_id = self._get_prev_id(header, cur_id, cur)
+        self._unlink(header, cur_id, cur)
+
+        if before_id == curprev_id:
+            # The before node has been modified during the unlink
+            before = self._get_node(before_id)
+
+        self._link(header, cur_id, cur, before.get_prev(), before_id, next_node=before)
+        self._save_header(header)
 
     def move_node_tail(self, cur_id: int) -> None:
-        # Move an existing node at the tail of the linkedlist 
-        if cur_id == self._tail_id.get():
+        # Move an existing node at the tail of the linkedlist
+        header = self._get_header()
+        if cur_id == header.tail_id:
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
         cur = self._get_node(cur_id)
-        tail_id = self._tail_id.get()
-        tail = self._get_node(tail_id)
-        curprev_id = cur.get_prev()
-        curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        curnext = self._get_node(curnext_id)
-
-        # curprev>nid
-        curprev.set_next(curnext_id)
-        # curnext>pid
-        curnext.set_prev(curprev_id)
-        # tail>nid
-        tail.set_next(cur_id)
-        # cur>pid
-        cur.set_prev(tail_id)
-        # update tail
-        self._tail_id.set(cur_id)
+        self._unlink(header, cur_id, cur)
+        self._link(header, cur_id, cur, header.tail_id, 0)
+        self._save_header(header)
 
     def move_node_head(self, cur_id: int) -> None:
-        # Move an existing node at the head of the linkedlist 
-        if cur_id == self._head_id.get():
+        # Move an existing node at the head of the linkedlist
+        header = self._get_header()
+        if cur_id == header.head_id:
             raise LinkedNodeCannotMoveItself(self._name, cur_id)
 
         cur = self._get_node(cur_id)
-        head_id = self._head_id.get()
-        head = self._get_node(head_id)
-        curprev_id = cur.get_prev()
-        curprev = self._get_node(curprev_id)
-        curnext_id = cur.get_next()
-        curnext = self._get_node(curnext_id)
-
-        # curprev>nid
-        curprev.set_next(curnext_id)
-        # curnext>pid
-        curnext.set_prev(curprev_id)
-        # head>pid
-        head.set_prev(cur_id)
-        # cur>nid
-        cur.set_next(head_id)
-        # update head
-        self._head_id.set(cur_id)
+        self._unlink(header, cur_id, cur)
+        self._link(header, cur_id, cur, 0, header.head_id)
+        self._save_header(header)
+
+    def _remove(self, header: _LinkedListHeader, cur_id: int) -> None:
+        cur = self._get_node(cur_id)
+        self._unlink(header, cur_id, cur)
+        cur.delete()
+        header.length -= 1
+        self._save_header(header)
 
     def remove_head(self) -> None:
-        # Remove the current head from the linkedlist 
-        if self._length.get() == 1:
-            self.clear()
-        else:
-            old_head = self._get_node(self._head_id.get())
-            new_head = old_head.get_next()
-            self._head_id.set(new_head)
-            self._get_node(new_head).set_prev(0)
-            old_head.delete()
-            self._length.set(self._length.get() - 1)
+        # Remove the current head from the linkedlist
+        header = self._get_header()
+        if not header.head_id:
+            raise EmptyLinkedListException(self._name)
+        self._remove(header, header.head_id)
 
     def remove_tail(self) -> None:
-        # Remove the current tail from the linkedlist 
-        if self._length.get() == 1:
-            self.clear()
-        else:
-            old_tail = self._get_node(self._tail_id.get())
-            new_tail = old_tail.get_prev()
-            self._tail_id.set(new_tail)
-            self._get_node(new_tail).set_next(0)
-            old_tail.delete()
-            self._length.set(self._length.get() - 1)
+        # Remove the current tail from the linkedlist
+        header = self._get_header()
+        if not header.tail_id:
+            raise EmptyLinkedListException(self._name)
+        self._remove(header, header.tail_id)
 
     def remove(self, cur_id: int) -> None:
-        # Remove a given node from the linkedlist 
-        if cur_id == self._head_id.get():
-            self.remove_head()
+        # Remove a given node from the linkedlist
+        self._remove(self._get_header(), cur_id)
 
-        elif cur_id == self._tail_id.get():
-            self.remove_tail()
+    def remove_many(self, node_ids: list) -> None:
+        # Remove multiple nodes from the linkedlist, the header is only written once
+        header = self._get_header()
 
-        else:
+        for cur_id in node_ids:
             cur = self._get_node(cur_id)
-            curnext_id = cur.get_next()
-            curnext = self._get_node(curnext_id)
-            curprev_id = cur.get_prev()
-            curprev = self._get_node(curprev_id)
-            curnext.set_prev(curprev_id)
-            curprev.set_next(curnext_id)
+            self._unlink(header, cur_id, cur)
             cur.delete()
-            self._length.set(self._length.get() - 1)
+            header.length -= 1
+
+        if node_ids:
+            self._save_header(header)
 
     def select(self, offset: int, cond=None, **kwargs) -> list:
-        # Returns a limited amount of items in the LinkedListDB that optionally fulfills a condition 
+        # Returns a limited amount of items in the LinkedListDB that optionally fulfills a condition
+        if self._index:
+            header = self._get_header()
+            if offset > header.length:
+                # Offset is bigger than the size of the linkedlist
+                raise ScorelibStopIteration(self._name)
+
+            cur_id = self._index.seek(header, offset)
+            if cur_id is not None:
+                # Seek the first item using the index
+                return self._select(cur_id, False, cond, **kwargs)[0] if cur_id else []
+
         items = iter(self)
         result = []
 
@@ -510,6 +1179,46 @@ class LinkedListDB:
 
         return result
 
+    def select_from(self, cur_id: int = 0, cond=None, **kwargs) -> tuple:
+        # Returns a limited amount of items in the LinkedListDB that optionally fulfills a condition,
+        # starting from a given node id (the head if not provided).
+        # The node id of the next page is returned along with the items, or 0 if the tail has been reached
+        return self._select(cur_id, False, cond, **kwargs)
+
+    def select_reverse(self, cur_id: int = 0, cond=None, **kwargs) -> tuple:
+        # Same than select_from, but going from the tail to the head.
+        # The node id of the next page is returned along with the items, or 0 if the head has been reached
+        return self._select(cur_id, True, cond, **kwargs)
+
+    def _select(self, cur_id: int, reverse: bool, cond=None, **kwargs) -> tuple:
+        header = self._get_header()
+        if not cur_id:
+            cur_id = header.tail_id if reverse else header.head_id
+
+        result = []
+
+        # Do a maximum iteration count of MAX_ITERATION_LOOP
+        for _ in range(MAX_ITERATION_LOOP):
+            if not cur_id:
+                # End of linkedlist : stop here
+                break
+
+            node = self._get_node(cur_id)
+            item = self._node_item(cur_id, node)
+            if cond:
+                if cond(self._db, item, **kwargs):
+                    result.append(item)
+            else:
+                result.append(item)
+
+            cur_id = self._get_adjacent_id(header, cur_id, node, reverse)
+
+        return result, cur_id
+
+    def _node_item(self, node_id: int, node):
+        # Returns the item yielded for a given node during an iteration or a selection
+        return (node_id, node.get_value())
+
 
 class UIDLinkedListDB(LinkedListDB):
     # UIDLinkedListDB is a linked list of unique IDs.
@@ -517,17 +1226,25 @@ class UIDLinkedListDB(LinkedListDB):
     # so the developer needs to make sure the UID provided is globally unique to the application.
     # Consequently, the concept of node ID is merged with the UID provided
     # from a developper point of view, which simplifies the usage of the linkedlist.
-    
+    # As the value of a node is its node ID, only the links of the nodes are stored,
+    # in a single slot per node (see the packed mode of LinkedListDB).
+
     _NAME = 'UID_LINKED_LIST_DB'
 
-    def __init__(self, address: Address, db: IconScoreDatabase):
+    def __init__(self, address: Address, db: IconScoreDatabase, indexed: bool = False):
         name = f'{str(address)}_{UIDLinkedListDB._NAME}'
-        super().__init__(name, db, int)
+        super().__init__(name, db, int, packed=True, indexed=indexed)
         self._name = name
 
+    def _packed_node(self, node_id: int, epoch: int, fallback: bool) -> _UIDNodeDB:
+        return _UIDNodeDB(node_id, self._node_key(node_id, epoch), self._db, fallback)
+
     def append(self, uid: int, _: int = None) -> None:
         super().append(uid, uid)
 
+    def extend(self, uids: list, _: list = None) -> None:
+        super().extend(uids, uids)
+
     def prepend(self, uid: int, _: int = None) -> None:
         super().prepend(uid, uid)
 
@@ -537,6 +1254,6 @@ class UIDLinkedListDB(LinkedListDB):
     def prepend_before(self, value: int, before_id: int, _: int = None) -> None:
         super().prepend_before(value, before_id, value)
 
-    def __iter__(self):
-        for node_id, uid in super().__iter__():
-            yield uid
+    def _node_item(self, node_id: int, node) -> int:
+        # The UID is the node id, no need to read the node value
+        return node_id
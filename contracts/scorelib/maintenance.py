@@ -24,6 +24,7 @@ class ScoreInMaintenanceException(Exception):
     pass
 
 
+@Utils.register_enum
 class IconScoreMaintenanceStatus:
     UNINITIALIZED = 0
     DISABLED = 1
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2021 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .binary_tree import *
+from .binary_tree import _BinaryTreeNode
+
+
+class _OrderedMapNode(_BinaryTreeNode):
+    # _OrderedMapNode is a node of the BinaryTreeDB storing the key of the entry and the height of its subtree
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, key_type: type, value_type: type):
+        super().__init__(var_key, db, value_type)
+        self._key = VarDB(f'{self._name}_key', db, key_type)
+        self._height = VarDB(f'{self._name}_height', db, int)
+
+    def __delete__(self) -> None:
+        super().__delete__()
+        self._key.remove()
+        self._height.remove()
+
+    def get_key(self):
+        return self._key.get()
+
+    def set_key(self, key) -> None:
+        self._key.set(key)
+
+    def get_height(self) -> int:
+        return self._height.get()
+
+    def set_height(self, height: int) -> None:
+        self._height.set(height)
+
+
+class _OrderedMapNodes:
+    # Fields of the nodes accessed during a single operation of the OrderedMapDB,
+    # so each field is read at most once and only the modified fields are written.
+    # The node 0 is the empty subtree.
+
+    _FIELDS = ['key', 'left', 'right', 'height']
+
+    def __init__(self, tree: 'OrderedMapDB'):
+        self._tree = tree
+        self._fields = {}
+
+    def get(self, node_id: int, field: str):
+        if node_id == 0:
+            return None if field == 'key' else 0
+        if (node_id, field) not in self._fields:
+            self._fields[(node_id, field)] = getattr(self._tree._node(node_id), f'get_{field}')()
+        return self._fields[(node_id, field)]
+
+    def set(self, node_id: int, field: str, value) -> None:
+        if (node_id, field) in self._fields and self._fields[(node_id, field)] == value:
+            return
+        self._fields[(node_id, field)] = value
+        getattr(self._tree._node(node_id), f'set_{field}')(value)
+
+    def update_height(self, node_id: int) -> None:
+        height = 1 + max(self.get(self.get(node_id, 'left'), 'height'), self.get(self.get(node_id, 'right'), 'height'))
+        self.set(node_id, 'height', height)
+
+    def balance(self, node_id: int) -> int:
+        return self.get(self.get(node_id, 'left'), 'height') - self.get(self.get(node_id, 'right'), 'height')
+
+    def rotate_right(self, node_id: int) -> int:
+        left = self.get(node_id, 'left')
+        self.set(node_id, 'left', self.get(left, 'right'))
+        self.set(left, 'right', node_id)
+        self.update_height(node_id)
+        self.update_height(left)
+        return left
+
+    def rotate_left(self, node_id: int) -> int:
+        right = self.get(node_id, 'right')
+        self.set(node_id, 'right', self.get(right, 'left'))
+        self.set(right, 'left', node_id)
+        self.update_height(node_id)
+        self.update_height(right)
+        return right
+
+    def rebalance(self, node_id: int) -> int:
+        # Returns the root of the rebalanced subtree
+        self.update_height(node_id)
+        balance = self.balance(node_id)
+
+        if balance > 1:
+            left = self.get(node_id, 'left')
+            if self.balance(left) < 0:
+                self.set(node_id, 'left', self.rotate_left(left))
+            return self.rotate_right(node_id)
+
+        if balance < -1:
+            right = self.get(node_id, 'right')
+            if self.balance(right) > 0:
+                self.set(node_id, 'right', self.rotate_right(right))
+            return self.rotate_left(node_id)
+
+        return node_id
+
+
+class OrderedMapDB(BinaryTreeDB):
+    # OrderedMapDB is a map sorted by keys, stored in a self-balancing (AVL) BinaryTreeDB.
+    # Lookups, insertions, deletions, floor and ceiling cost O(log n) reads,
+    # and iterating a range of k entries costs O(log n + k) reads.
+
+    _NAME = '_ORDERED_MAP'
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, key_type: type, value_type: type):
+        super().__init__(var_key + OrderedMapDB._NAME, db, value_type)
+        self._key_type = key_type
+        self._root = VarDB(f'{self._name}_root', db, int)
+        self._size = VarDB(f'{self._name}_size', db, int)
+
+    def _node(self, node_id) -> _OrderedMapNode:
+        return _OrderedMapNode(str(node_id) + self._name, self._db, self._key_type, self._value_type)
+
+    def _find(self, key) -> int:
+        # Returns the node containing a given key, or 0 if the key doesn't exist
+        node_id = self._root.get()
+        while node_id:
+            node = self._node(node_id)
+            cur = node.get_key()
+            if key == cur:
+                return node_id
+            node_id = node.get_left() if key < cur else node.get_right()
+        return 0
+
+    def __len__(self) -> int:
+        return self._size.get()
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) != 0
+
+    def __getitem__(self, key):
+        node_id = self._find(key)
+        if not node_id:
+            raise TreeNodeNotFound(self._name, str(key))
+        return self.get_node_value(node_id)
+
+    def get(self, key, default=None):
+        node_id = self._find(key)
+        return self.get_node_value(node_id) if node_id else default
+
+    def __setitem__(self, key, value) -> None:
+        nodes = _OrderedMapNodes(self)
+        # Ancestors of the inserted node, from the root
+        path = []
+        node_id = self._root.get()
+
+        while node_id:
+            cur = nodes.get(node_id, 'key')
+            if key == cur:
+                self._node(node_id).set_value(value)
+                return
+            path.append(node_id)
+            node_id = nodes.get(node_id, 'left' if key < cur else 'right')
+
+        node_id, node = self._create_node(value)
+        node.set_key(key)
+        node.set_height(1)
+        self._size.set(self._size.get() + 1)
+
+        if not path:
+            self._root.set(node_id)
+            return
+
+        parent = path[-1]
+        nodes.set(parent, 'left' if key < nodes.get(parent, 'key') else 'right', node_id)
+        self._retrace(nodes, path, True)
+
+    def __delitem__(self, key) -> None:
+        nodes = _OrderedMapNodes(self)
+        path = []
+        node_id = self._root.get()
+
+        while node_id:
+            cur = nodes.get(node_id, 'key')
+            if key == cur:
+                break
+            path.append(node_id)
+            node_id = nodes.get(node_id, 'left' if key < cur else 'right')
+
+        if not node_id:
+            raise TreeNodeNotFound(self._name, str(key))
+
+        left, right = nodes.get(node_id, 'left'), nodes.get(node_id, 'right')
+
+        if left and right:
+            # Move the entry of the successor into the deleted node, and delete the successor node instead
+            path.append(node_id)
+            successor = right
+            while nodes.get(successor, 'left'):
+                path.append(successor)
+                successor = nodes.get(successor, 'left')
+
+            nodes.set(node_id, 'key', nodes.get(successor, 'key'))
+            self._node(node_id).set_value(self.get_node_value(successor))
+            removed, child = successor, nodes.get(successor, 'right')
+        else:
+            removed, child = node_id, left or right
+
+        if path:
+            parent = path[-1]
+            nodes.set(parent, 'left' if nodes.get(parent, 'left') == removed else 'right', child)
+        else:
+            self._root.set(child)
+
+        self._node(removed).__delete__()
+        self._size.set(self._size.get() - 1)
+        self._retrace(nodes, path, False)
+
+    def _retrace(self, nodes: _OrderedMapNodes, path: list, insertion: bool) -> None:
+        # Rebalance the ancestors of an inserted or deleted node, from the bottom
+        for index in range(len(path) - 1, -1, -1):
+            node_id = path[index]
+            height = nodes.get(node_id, 'height')
+            subtree = nodes.rebalance(node_id)
+
+            if subtree != node_id:
+                if index == 0:
+                    self._root.set(subtree)
+                else:
+                    parent = path[index - 1]
+                    nodes.set(parent, 'left' if nodes.get(parent, 'left') == node_id else 'right', subtree)
+                if insertion:
+                    # A single rotation restores the height of the subtree after an insertion
+                    return
+
+            if nodes.get(subtree, 'height') == height:
+                # The height of the upper subtrees is unchanged
+                return
+
+    def floor(self, key):
+        # Returns the greatest key lower or equal to a given key, or None
+        result = None
+        node_id = self._root.get()
+        while node_id:
+            node = self._node(node_id)
+            cur = node.get_key()
+            if key == cur:
+                return cur
+            if cur < key:
+                result = cur
+                node_id = node.get_right()
+            else:
+                node_id = node.get_left()
+        return result
+
+    def ceiling(self, key):
+        # Returns the lowest key greater or equal to a given key, or None
+        result = None
+        node_id = self._root.get()
+        while node_id:
+            node = self._node(node_id)
+            cur = node.get_key()
+            if key == cur:
+                return cur
+            if cur > key:
+                result = cur
+                node_id = node.get_left()
+            else:
+                node_id = node.get_right()
+        return result
+
+    def items(self, start=None, end=None):
+        # Iterate the key,value pairs in ascending order of keys, with start <= key <= end
+        stack = []
+        node_id = self._root.get()
+
+        while node_id or stack:
+            # Descend to the lowest key of the subtree in the range
+            while node_id:
+                node = self._node(node_id)
+                cur = node.get_key()
+                if start is not None and cur < start:
+                    node_id = node.get_right()
+                else:
+                    stack.append((node_id, cur))
+                    node_id = node.get_left()
+
+            if not stack:
+                return
+
+            node_id, cur = stack.pop()
+            if end is not None and cur > end:
+                return
+
+            yield cur, self.get_node_value(node_id)
+            node_id = self._node(node_id).get_right()
+
+    def keys(self, start=None, end=None):
+        for key, _ in self.items(start, end):
+            yield key
+
+    def __iter__(self):
+        return self.keys()
@@ -24,13 +24,18 @@ class SetDB(BagDB):
 
     _NAME = '_SETDB'
 
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, order=False):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, order=False, epoch=False, tombstones=False):
         name = var_key + SetDB._NAME
-        super().__init__(name, db, value_type, order)
-        self._indexes = DictDB(f'{self._name}_indexes', db, value_type=int)
+        super().__init__(name, db, value_type, order, epoch, tombstones)
+        self._indexes_name = f'{self._name}_indexes'
+        self._indexes = self._epoch_indexes(self._current_epoch)
         self._name = name
         self._db = db
 
+    def _epoch_indexes(self, epoch: int) -> DictDB:
+        name = f'{self._indexes_name}_{epoch}' if epoch else self._indexes_name
+        return DictDB(name, self._db, value_type=int)
+
     def __contains__(self, item) -> bool:
         return item in self._indexes
 
@@ -39,61 +44,159 @@ class SetDB(BagDB):
         # If it already exists, it *does not raise* any exception
         if item not in self:
             super().add(item)
-            self._indexes[item] = len(self)
+            self._indexes[item] = len(self._items)
+
+    def add_many(self, items) -> list:
+        # Adds multiple elements to the set, returns whether each element has been added
+        # The length of the set is only read once
+        result = []
+        added = set()
+        size = len(self._items)
+
+        for item in items:
+            if item in added or item in self:
+                result.append(False)
+                continue
+            super().add(item)
+            size += 1
+            self._indexes[item] = size
+            added.add(item)
+            result.append(True)
+
+        return result
+
+    def contains_many(self, items) -> list:
+        # Returns whether each element exists in the set
+        return [item in self for item in items]
 
     def remove(self, item) -> None:
         # This operation removes element x from the set.
         # If element x does not exist, it raises a ItemNotFound.
         if item not in self._indexes:
             raise ItemNotFound(self._name, str(item))
-        
-        del self._indexes[item]
-        super().remove(item)
+
+        self._remove(item)
 
     def discard(self, item) -> None:
         # This operation also removes element x from the set.
         # If element x does not exist, it *does not raise* a ItemNotFound.
         if item in self:
-            del self._indexes[item]
-            super().remove(item)
+            self._remove(item)
+
+    def remove_many(self, items) -> list:
+        # Removes multiple elements from the set, returns whether each element has been removed
+        # Missing elements *do not raise* a ItemNotFound.
+        result = []
+        for item in items:
+            # The stored index is never null, so a single read tells if the element exists
+            index = self._indexes[item]
+            if index:
+                self._remove(item, index)
+            result.append(index != 0)
+        return result
 
-    def pop(self):
-        # Removes an element from the set and returns it 
-        item = self._items.pop()
+    def _remove(self, item, index: int = None) -> None:
+        # The index of an item is its position in the array + 1
+        if index is None:
+            index = self._indexes[item]
+        index -= 1
         del self._indexes[item]
+
+        if not self._order or self._tombstones is not None:
+            if (0 <= index < len(self._items)
+                and self._items[index] == item
+                and not (self._get_tombstones() >> index) & 1):
+                if self._tombstones is None:
+                    # Replace the item with the tail of the array
+                    self._swap_remove(index)
+                else:
+                    # Replace the item with a tombstone
+                    self._remove_slot(index)
+                return
+
+        # Ordered sets without tombstones need to shift the next items.
+        # The indexes of the items moved by a previous version of SetDB may also be outdated
+        super().remove(item)
+
+    def _moved(self, item, index: int) -> None:
+        # Keep the index of the moved item up to date
+        self._indexes[item] = index + 1
+
+    def clear(self) -> None:
+        # Removes all the elements from the set
+        super().clear()
+        self._indexes = self._epoch_indexes(self._current_epoch)
+
+    def _pop_item(self, items: ArrayDB, epoch: int):
+        item = items.pop()
+        indexes = self._indexes if epoch == self._current_epoch else self._epoch_indexes(epoch)
+        del indexes[item]
         return item
 
-    def difference(self, other: set):
+    @staticmethod
+    def _operand(other):
+        # Set operations accept a SetDB, a set, or any iterable converted into a set
+        if isinstance(other, (SetDB, set, frozenset)):
+            return other
+        return set(other)
+
+    def _smaller_first(self, other) -> tuple:
+        # Iterating the smaller operand and probing the other one minimizes the DB reads
+        if len(other) < len(self):
+            return other, self
+        return self, other
+
+    def difference(self, other):
         # Returns a set containing the difference between two or more sets 
-        return self._to_set().difference(other)
+        other = SetDB._operand(other)
+        return {item for item in self if item not in other}
 
-    def intersection(self, other: set):
+    def intersection(self, other):
         # Returns a set, that is the intersection of two other sets 
-        return self._to_set().intersection(other)
+        smaller, larger = self._smaller_first(SetDB._operand(other))
+        return {item for item in smaller if item in larger}
 
-    def isdisjoint(self, other: set) -> bool:
+    def isdisjoint(self, other) -> bool:
         # Returns whether two sets have a intersection or not 
-        return self._to_set().isdisjoint(other)
+        smaller, larger = self._smaller_first(SetDB._operand(other))
+        for item in smaller:
+            if item in larger:
+                return False
+        return True
 
-    def issubset(self, other: set) -> bool:
+    def issubset(self, other) -> bool:
         # Returns whether another set contains this set or not 
-        return self._to_set().issubset(other)
+        other = SetDB._operand(other)
+        if len(self) > len(other):
+            return False
+        for item in self:
+            if item not in other:
+                return False
+        return True
 
-    def issuperset(self, other: set) -> bool:
+    def issuperset(self, other) -> bool:
         # Returns whether this set contains another set or not 
-        return self._to_set().issuperset(other)
-
-    def symmetric_difference(self, other: set):
+        other = SetDB._operand(other)
+        if len(other) > len(self):
+            return False
+        for item in other:
+            if item not in self:
+                return False
+        return True
+
+    def symmetric_difference(self, other):
         # Returns a set with the symmetric differences of two sets 
         return self._to_set().symmetric_difference(other)
 
-    def union(self, other: set):
+    def union(self, other):
         # Return a set containing the union of sets 
         return self._to_set().union(other)
 
     def update(self, *others) -> None:
         # Update the set with the union of this set and others 
-        self._to_set().update(others)
+        for other in others:
+            for item in other:
+                self.add(item)
 
     def _to_set(self) -> set:
         result = set()
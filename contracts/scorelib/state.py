@@ -37,9 +37,10 @@ class StateDB:
     # ================================================
     #  Initialization
     # ================================================
-    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type):
+    def __init__(self, var_key: str, db: IconScoreDatabase, value_type: type, var=None):
+        # The state may be stored in a VarDB-like object provided by the caller
         self._name = var_key + StateDB._NAME
-        self._state = VarDB(f"{self._name}_state", db, value_type=int)
+        self._state = var if var is not None else VarDB(StateDB.var_name(var_key), db, value_type=int)
         self._cls = value_type
         self._db = db
 
@@ -47,6 +48,11 @@ class StateDB:
         if Utils.enum_names(value_type)[0] != "UNINITIALIZED":
             raise InvalidStateClass(f"{value_type} needs an UNINITIALIZED state equals to 0 in its declaration")
 
+    @staticmethod
+    def var_name(var_key: str) -> str:
+        # Name of the VarDB storing the state
+        return f"{var_key}{StateDB._NAME}_state"
+
     # ================================================
     #  External methods
     # ================================================
@@ -57,7 +63,7 @@ class StateDB:
         return self._state.get()
 
     def get_name(self) -> str:
-        return Utils.enum_names(self._cls)[self._state.get()]
+        return Utils.get_enum_name(self._cls, self._state.get())
 
     # ================================================
     #  Checks
@@ -70,12 +76,12 @@ class StateDB:
         if self._state.get() != state:
             raise InvalidState(
                 self._name,
-                Utils.enum_names(self._cls)[self._state.get()],
-                Utils.enum_names(self._cls)[state])
+                Utils.get_enum_name(self._cls, self._state.get()),
+                Utils.get_enum_name(self._cls, state))
 
     def check_not(self, state: int) -> None:
         if self._state.get() == state:
             raise InvalidState(
                 self._name,
-                Utils.enum_names(self._cls)[self._state.get()],
-                Utils.enum_names(self._cls)[state])
+                Utils.get_enum_name(self._cls, self._state.get()),
+                Utils.get_enum_name(self._cls, state))
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2021 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .codec import *
+
+
+class InvalidStructField(Exception):
+    pass
+
+
+class InvalidStructVersion(Exception):
+    pass
+
+
+class _StructField:
+    # VarDB-like accessor to a single field of a StructDB
+
+    def __init__(self, struct: 'StructDB', name: str):
+        self._struct = struct
+        self._name = name
+
+    def get(self):
+        return self._struct.get(self._name)
+
+    def set(self, value) -> None:
+        self._struct.set(self._name, value)
+
+    def remove(self) -> None:
+        self._struct.set(self._name, None)
+
+
+class StructDB:
+    # StructDB stores all the fields of a record in a single slot, packed with Codec.
+    # The fields are declared as a list of (name, type) tuples. A field previously stored in its own VarDB
+    # may declare the name of that VarDB as a third element : (name, type, legacy_var_key).
+    # By default, the legacy VarDB of a field is named "{var_key}_{name}".
+    # The record is read once, and the legacy fields of a record that hasn't been packed yet are read
+    # only when accessed. The record is packed on its first write, and its legacy VarDBs are removed.
+    # The slot starts with the version of the layout. Fields may be appended to a layout in a new version,
+    # records packed with a previous version return the default value of these fields.
+
+    _NAME = '_STRUCTDB'
+    # Value of a legacy field that hasn't been read yet
+    _UNREAD = object()
+
+    def __init__(self, var_key: str, db: IconScoreDatabase, fields: list, version: int = 1):
+        self._name = var_key + StructDB._NAME
+        self._slot = VarDB(self._name, db, value_type=bytes)
+        self._names = [field[0] for field in fields]
+        self._types = [field[1] for field in fields]
+        self._legacy = [field[2] if len(field) > 2 else f'{var_key}_{field[0]}' for field in fields]
+        self._positions = {name: position for position, name in enumerate(self._names)}
+        self._version = version
+        self._db = db
+        # Values of the fields, loaded on first access
+        self._values = None
+        self._packed = False
+
+    def _position(self, name: str) -> int:
+        if name not in self._positions:
+            raise InvalidStructField(self._name, name)
+        return self._positions[name]
+
+    def _load(self) -> None:
+        data = self._slot.get()
+        if data:
+            version, *values = Codec.decode(data, [int] + self._types)
+            if version > self._version:
+                raise InvalidStructVersion(self._name, version)
+            self._values = values
+            self._packed = True
+        else:
+            self._values = [StructDB._UNREAD] * len(self._names)
+            self._packed = False
+
+    def _legacy_var(self, position: int) -> VarDB:
+        return VarDB(self._legacy[position], self._db, value_type=self._types[position])
+
+    def _load_legacy(self, position: int):
+        if self._values[position] is StructDB._UNREAD:
+            self._values[position] = self._legacy_var(position).get()
+        return self._values[position]
+
+    def _save(self) -> None:
+        self._slot.set(Codec.encode([self._version] + self._values, [int] + self._types))
+        self._packed = True
+
+    def get(self, name: str):
+        position = self._position(name)
+        if self._values is None:
+            self._load()
+        if not self._packed:
+            return self._load_legacy(position)
+        return self._values[position]
+
+    def set(self, name: str, value) -> None:
+        self.update({name: value})
+
+    def update(self, values: dict) -> None:
+        # Write multiple fields at once
+        positions = [(self._position(name), value) for name, value in values.items()]
+
+        if self._values is None:
+            self._load()
+        if not self._packed:
+            # Move the remaining legacy fields to the packed record
+            for position in range(len(self._names)):
+                self._load_legacy(position)
+                self._legacy_var(position).remove()
+
+        for position, value in positions:
+            self._values[position] = value if value is not None else Codec.default(self._types[position])
+        self._save()
+
+    def create(self, values: dict) -> None:
+        # Write a new record, without reading any previous value.
+        # The fields that aren't given have their default value
+        positions = [(self._position(name), value) for name, value in values.items()]
+        self._values = [Codec.default(value_type) for value_type in self._types]
+        for position, value in positions:
+            self._values[position] = value if value is not None else Codec.default(self._types[position])
+        self._save()
+
+    def field(self, name: str) -> _StructField:
+        self._position(name)
+        return _StructField(self, name)
@@ -24,14 +24,36 @@ class Utils():
     LOOP_TO_ICX = 10**18
 
     # Enums
+    # Names, values and value to name map of each enum class, computed once per class.
+    # The tables are shared and shouldn't be modified by the callers
+    _ENUMS = {}
+
+    @staticmethod
+    def register_enum(cls):
+        # Computes the tables of an enum class, may be used as a class decorator
+        if cls not in Utils._ENUMS:
+            items = [(name, value) for name, value in cls.__dict__.items() if name[:1] != '_']
+            Utils._ENUMS[cls] = (
+                [name for name, _ in items],
+                [value for _, value in items],
+                {value: name for name, value in items}
+            )
+        return cls
+
+    @staticmethod
+    def _enum_tables(cls) -> tuple:
+        if cls not in Utils._ENUMS:
+            Utils.register_enum(cls)
+        return Utils._ENUMS[cls]
+
     @staticmethod
     def enum_names(cls):
-        return [i for i in cls.__dict__.keys() if i[:1] != '_']
+        return Utils._enum_tables(cls)[0]
 
     @staticmethod
     def enum_values(cls):
-        return [i[1] for i in cls.__dict__.items() if i[0][0] != '_']
+        return Utils._enum_tables(cls)[1]
 
     @staticmethod
-    def get_enum_name(cls, index):
-        return Utils.enum_names(cls)[index]
+    def get_enum_name(cls, value):
+        return Utils._enum_tables(cls)[2][value]
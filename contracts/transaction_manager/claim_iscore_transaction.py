@@ -43,13 +43,19 @@ class ClaimIscoreTransaction(IncomingTransaction):
     def __init__(self, uid: int, db: IconScoreDatabase):
         super().__init__(uid, db)
         name = f"{ClaimIscoreTransaction._NAME}_{uid}"
-        self._iscore = VarDB(f"{name}_iscore", db, value_type=int)
-        self._claimer_uid = VarDB(f"{name}_claimer_uid", db, value_type=int)
+        self._claim_iscore_record = StructDB(name, db, [
+            ("iscore", int),
+            ("claimer_uid", int),
+        ])
+        self._iscore = self._claim_iscore_record.field("iscore")
+        self._claimer_uid = self._claim_iscore_record.field("claimer_uid")
     
     def set(self, token: Address, source: Address, amount: int, iscore: int, claimer_uid: int) -> None:
         super().set(token, source, amount)
-        self._iscore.set(iscore)
-        self._claimer_uid.set(claimer_uid)
+        self._claim_iscore_record.create({
+            "iscore": iscore,
+            "claimer_uid": claimer_uid
+        })
 
     # ================================================
     #  Internal methods
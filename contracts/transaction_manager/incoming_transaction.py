@@ -40,14 +40,21 @@ class IncomingTransaction(Transaction):
     def __init__(self, uid: int, db: IconScoreDatabase):
         super().__init__(uid, db)
         name = f"{IncomingTransaction._NAME}_{uid}"
-        self._token = VarDB(f"{name}_token", db, value_type=Address)
-        self._source = VarDB(f"{name}_source", db, value_type=Address)
-        self._amount = VarDB(f"{name}_amount", db, value_type=int)
+        self._incoming_record = StructDB(name, db, [
+            ("token", Address),
+            ("source", Address),
+            ("amount", int),
+        ])
+        self._token = self._incoming_record.field("token")
+        self._source = self._incoming_record.field("source")
+        self._amount = self._incoming_record.field("amount")
     
     def set(self, token: Address, source: Address, amount: int) -> None:
-        self._token.set(token)
-        self._source.set(source)
-        self._amount.set(amount)
+        self._incoming_record.create({
+            "token": token,
+            "source": source,
+            "amount": amount
+        })
 
     # ================================================
     #  Internal methods
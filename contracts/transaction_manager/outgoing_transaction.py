@@ -34,6 +34,7 @@ class OutgoingTransactionHasParticipation(Exception):
     pass
 
 
+@Utils.register_enum
 class OutgoingTransactionState:
     UNINITIALIZED = 0
     WAITING = 1
@@ -58,10 +59,13 @@ class OutgoingTransactionFactory:
         transaction = OutgoingTransaction(transaction_uid, db)
         transaction.build(TransactionType.OUTGOING, timestamp, txhash)
 
-        transaction._state.set(OutgoingTransactionState.WAITING)
+        transaction._outgoing_record.create({"state": OutgoingTransactionState.WAITING})
 
-        for sub_transaction in sub_transactions:
-            sub_transaction_uid = SubOutgoingTransactionFactory.create(db, sub_transaction)
+        # Reserve the UIDs of all the sub transactions at once
+        sub_transaction_uids = SubOutgoingTransactionFactory.reserve(db, len(sub_transactions))
+
+        for sub_transaction, sub_transaction_uid in zip(sub_transactions, sub_transaction_uids):
+            SubOutgoingTransactionFactory.create(db, sub_transaction, sub_transaction_uid)
             transaction._sub_transactions.put(sub_transaction_uid)
 
         return transaction_uid
@@ -77,12 +81,17 @@ class OutgoingTransaction(Transaction):
     def __init__(self, uid: int, db: IconScoreDatabase):
         super().__init__(uid, db)
         name = f"{OutgoingTransaction._NAME}_{uid}"
-        self._confirmations = SetDB(f"{name}_confirmations", db, value_type=int, order=True)
-        self._rejections = SetDB(f"{name}_rejections", db, value_type=int, order=True)
-        self._state = StateDB(f"{name}_state", db, value_type=OutgoingTransactionState)
+        self._confirmations = SetDB(f"{name}_confirmations", db, value_type=int, order=True, tombstones=True)
+        self._rejections = SetDB(f"{name}_rejections", db, value_type=int, order=True, tombstones=True)
+        self._outgoing_record = StructDB(name, db, [
+            ("state", int, StateDB.var_name(f"{name}_state")),
+            ("executed_timestamp", int),
+            ("executed_txhash", bytes),
+        ])
+        self._state = StateDB(f"{name}_state", db, value_type=OutgoingTransactionState, var=self._outgoing_record.field("state"))
         self._sub_transactions = ArrayDB(f"{name}_sub_transactions", db, value_type=int)
-        self._executed_timestamp = VarDB(f"{name}_executed_timestamp", db, value_type=int)
-        self._executed_txhash = VarDB(f"{name}_executed_txhash", db, value_type=bytes)
+        self._executed_timestamp = self._outgoing_record.field("executed_timestamp")
+        self._executed_txhash = self._outgoing_record.field("executed_txhash")
         self._db = db
 
     # ================================================
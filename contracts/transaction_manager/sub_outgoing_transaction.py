@@ -16,6 +16,7 @@
 
 from iconservice import *
 from ..scorelib.id_factory import IdFactory
+from ..scorelib.struct import *
 from ..type_converter.type_converter import *
 
 
@@ -46,7 +47,11 @@ class SubOutgoingTransactionFactory:
             ScoreTypeConverter.convert(param["type"], param["value"])
 
     @staticmethod
-    def create(db: IconScoreDatabase, params: SubOutgoingTransactionParam) -> int:
+    def reserve(db: IconScoreDatabase, count: int) -> range:
+        return IdFactory(SubOutgoingTransactionFactory._NAME, db).reserve(count)
+
+    @staticmethod
+    def create(db: IconScoreDatabase, params: SubOutgoingTransactionParam, uid: int = None) -> int:
 
         destination: Address = Address.from_string(params["destination"])
         method_name: str = params["method_name"]
@@ -62,14 +67,17 @@ class SubOutgoingTransactionFactory:
             raise IconScoreException("Cannot set a method name or params to a EOA transfer transaction")
 
         # --- OK from here ---
-        uid = IdFactory(SubOutgoingTransactionFactory._NAME, db).get_uid()
+        if uid is None:
+            uid = IdFactory(SubOutgoingTransactionFactory._NAME, db).get_uid()
 
         sub_tx = SubOutgoingTransaction(uid, db)
-        sub_tx._destination.set(destination)
-        sub_tx._method_name.set(method_name)
-        sub_tx._params.set(tx_params)
-        sub_tx._amount.set(amount)
-        sub_tx._description.set(description)
+        sub_tx._record.create({
+            "destination": destination,
+            "method_name": method_name,
+            "params": tx_params,
+            "amount": amount,
+            "description": description
+        })
 
         return uid
 
@@ -83,11 +91,18 @@ class SubOutgoingTransaction:
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
         name = f"{SubOutgoingTransaction._NAME}_{uid}"
-        self._destination = VarDB(f"{name}_destination", db, value_type=Address)
-        self._method_name = VarDB(f"{name}_method_name", db, value_type=str)
-        self._params = VarDB(f"{name}_params", db, value_type=str)
-        self._amount = VarDB(f"{name}_amount", db, value_type=int)
-        self._description = VarDB(f"{name}_description", db, value_type=str)
+        self._record = StructDB(name, db, [
+            ("destination", Address),
+            ("method_name", str),
+            ("params", str),
+            ("amount", int),
+            ("description", str),
+        ])
+        self._destination = self._record.field("destination")
+        self._method_name = self._record.field("method_name")
+        self._params = self._record.field("params")
+        self._amount = self._record.field("amount")
+        self._description = self._record.field("description")
 
     # ================================================
     #  Internal methods
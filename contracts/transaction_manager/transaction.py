@@ -17,7 +17,9 @@
 from iconservice import *
 
 from ..scorelib.state import *
+from ..scorelib.struct import *
 
+@Utils.register_enum
 class TransactionType:
     UNINITIALIZED = 0
     OUTGOING = 1
@@ -34,16 +36,23 @@ class Transaction:
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
         name = f"{Transaction._NAME}_{uid}"
-        self._type = StateDB(f"{name}_type", db, value_type=TransactionType)
-        self._created_timestamp = VarDB(f"{name}_created_timestamp", db, value_type=int)
-        self._created_txhash = VarDB(f"{name}_created_txhash", db, value_type=bytes)
+        self._record = StructDB(name, db, [
+            ("type", int, StateDB.var_name(f"{name}_type")),
+            ("created_timestamp", int),
+            ("created_txhash", bytes),
+        ])
+        self._type = StateDB(f"{name}_type", db, value_type=TransactionType, var=self._record.field("type"))
+        self._created_timestamp = self._record.field("created_timestamp")
+        self._created_txhash = self._record.field("created_txhash")
         self._uid = uid
         self._name = name
 
     def build(self, txtype: int, timestamp: int, created_txhash: bytes) -> None:
-        self._type.set(txtype)
-        self._created_timestamp.set(timestamp)
-        self._created_txhash.set(created_txhash)
+        self._record.create({
+            "type": txtype,
+            "created_timestamp": timestamp,
+            "created_txhash": created_txhash
+        })
 
     # ================================================
     #  Internal methods
@@ -18,6 +18,7 @@ from iconservice import *
 from ..scorelib.maintenance import *
 from ..scorelib.auth import *
 from ..scorelib.version import *
+from ..scorelib.consts import *
 from ..scorelib.linked_list import *
 
 from ..interfaces.transaction_manager import *
@@ -52,47 +53,47 @@ class TransactionManager(
     # ================================================
     #  Event Logs
     # ================================================
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=1)
     def TransactionCreated(self, transaction_uid: int, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=2)
     def TransactionConfirmed(self, transaction_uid: int, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=2)
     def TransactionRevoked(self, transaction_uid: int, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=2)
     def TransactionRejected(self, transaction_uid: int, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=1)
     def TransactionCancelled(self, transaction_uid: int, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=1)
     def TransactionForceCancelled(self, transaction_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=1)
     def TransactionExecutionSuccess(self, transaction_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=1)
     def TransactionRejectionSuccess(self, transaction_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="transaction_uid")
     @eventlog(indexed=1)
     def TransactionExecutionFailure(self, transaction_uid: int, error: str):
         pass
@@ -103,9 +104,9 @@ class TransactionManager(
     def __init__(self, db: IconScoreDatabase) -> None:
         super().__init__(db)
         self._waiting_transactions = UIDLinkedListDB(f"{TransactionManager._NAME}_waiting_transactions", self.db)
-        self._executed_transactions = UIDLinkedListDB(f"{TransactionManager._NAME}_executed_transactions", self.db)
+        self._executed_transactions = UIDLinkedListDB(f"{TransactionManager._NAME}_executed_transactions", self.db, indexed=True)
         self._rejected_transactions = UIDLinkedListDB(f"{TransactionManager._NAME}_rejected_transactions", self.db)
-        self._all_transactions = UIDLinkedListDB(f"{TransactionManager._NAME}_all_transactions", self.db)
+        self._all_transactions = UIDLinkedListDB(f"{TransactionManager._NAME}_all_transactions", self.db, indexed=True)
 
     def on_install(self, registrar_address: Address) -> None:
         super().on_install()
@@ -119,6 +120,14 @@ class TransactionManager(
         # if self.is_less_than_target_version('1.0.0'):
         #     self._migrate_v1_0_0()
 
+        # The transactions lists switched to the packed layout, migrate their first nodes.
+        # The remaining nodes are migrated with migrate_transactions
+        self.__migrate_transactions(MAX_ITERATION_LOOP)
+
+        # The executed and all transactions lists have been indexed, index their first nodes.
+        # The remaining nodes are indexed with build_transactions_index
+        self.__build_transactions_index(MAX_ITERATION_LOOP)
+
         self.version_update(VERSION)
 
     @external(readonly=True)
@@ -140,6 +149,20 @@ class TransactionManager(
             # Enough rejections for the current transaction, reject it
             self.__do_reject_transaction(transaction_uid)
 
+    def __migrate_transactions(self, max_count: int) -> None:
+        # Only migrate the first list that isn't migrated yet, so no more than max_count nodes are migrated
+        for transactions in [self._waiting_transactions, self._executed_transactions, self._rejected_transactions, self._all_transactions]:
+            if not transactions.is_migrated():
+                transactions.migrate(max_count)
+                return
+
+    def __build_transactions_index(self, max_count: int) -> None:
+        # Only index the first list that isn't indexed yet, so no more than max_count nodes are indexed
+        for transactions in [self._executed_transactions, self._all_transactions]:
+            if not transactions.is_indexed():
+                transactions.build_index(max_count)
+                return
+
     def __serialize_transaction(self, transaction_uid: int) -> dict:
         transaction = Transaction(transaction_uid, self.db)
         transaction_type = transaction._type.get()
@@ -153,6 +176,16 @@ class TransactionManager(
         else:
             raise InvalidTransactionType(transaction._type.get())
  
+    def __serialize_transactions_from(self, transactions: UIDLinkedListDB, cursor: int, reverse: bool = False) -> dict:
+        if reverse:
+            transaction_uids, next_cursor = transactions.select_reverse(cursor)
+        else:
+            transaction_uids, next_cursor = transactions.select_from(cursor)
+        return {
+            "items": [self.__serialize_transaction(transaction_uid) for transaction_uid in transaction_uids],
+            "next_cursor": next_cursor
+        }
+
     def __handle_incoming_transaction(self, token: Address, source: Address, amount: int) -> int:
         if amount > 0:
             transaction_uid = TransactionFactory.create(self.db, TransactionType.INCOMING, self.tx.hash, self.now(), token, source, amount)
@@ -195,11 +228,13 @@ class TransactionManager(
         # Move the transaction from the waiting transactions
         self._waiting_transactions.remove(transaction_uid)
         self._executed_transactions.append(transaction_uid)
-        transaction._executed_txhash.set(self.tx.hash)
 
         try:
             # Avoid re-entrancy vulnerability by setting the transaction state before the call
-            transaction._state.set(OutgoingTransactionState.EXECUTED)
+            transaction._outgoing_record.update({
+                "executed_txhash": self.tx.hash,
+                "state": OutgoingTransactionState.EXECUTED
+            })
             
             # Rational behind calling call_transaction as an external method instead of an internal method:
             # If a multisigned transaction fails during the execution of any subtx (for any reason, such as no balance in the multisig wallet), 
@@ -222,7 +257,7 @@ class TransactionManager(
         
     def __is_iconsafe(self, address: Address) -> bool:
         name = IconSafeProxy.NAME
-        iconsafe = self.registrar.resolve(name)
+        iconsafe = self.resolve_domain(name)
         if not iconsafe:
             raise AddressNotInRegistrar(name)
         return address == iconsafe
@@ -266,6 +301,52 @@ class TransactionManager(
         if not self.__is_iconsafe(self.msg.sender):
             self.__handle_incoming_transaction(self.msg.sender, _from, _value)
 
+    # ================================================
+    #  OnlyOwner External methods
+    # ================================================
+    @external
+    @only_owner
+    def migrate_transactions(self, max_count: int = MAX_ITERATION_LOOP) -> None:
+        # Access
+        #   - TransactionManager contract operator only
+        # Description 
+        #   - Migrate a limited amount of nodes of the transactions lists stored with the legacy layout.
+        #     Call it until get_transactions_migrated returns True
+        # Parameters 
+        #   - max_count : maximum amount of nodes migrated, up to MAX_ITERATION_LOOP
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotScoreOwnerError
+        self.__migrate_transactions(min(max_count, MAX_ITERATION_LOOP))
+
+    @external(readonly=True)
+    def get_transactions_migrated(self) -> bool:
+        return all([
+            transactions.is_migrated() 
+            for transactions in [self._waiting_transactions, self._executed_transactions, self._rejected_transactions, self._all_transactions]
+        ])
+
+    @external
+    @only_owner
+    def build_transactions_index(self, max_count: int = MAX_ITERATION_LOOP) -> None:
+        # Access
+        #   - TransactionManager contract operator only
+        # Description 
+        #   - Add a limited amount of existing transactions to the index of the executed and all transactions lists.
+        #     The index is only used once it is complete : call it until get_transactions_indexed returns True
+        # Parameters 
+        #   - max_count : maximum amount of nodes indexed, up to MAX_ITERATION_LOOP
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotScoreOwnerError
+        self.__build_transactions_index(min(max_count, MAX_ITERATION_LOOP))
+
+    @external(readonly=True)
+    def get_transactions_indexed(self) -> bool:
+        return self._executed_transactions.is_indexed() and self._all_transactions.is_indexed()
+
     # ================================================
     #  OnlyTransactionManager External methods
     # ================================================
@@ -325,6 +406,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def force_cancel_transaction(self, transaction_uid: int) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -352,6 +434,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def submit_transaction(self, sub_transactions: str, wallet_owner: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -379,6 +462,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def confirm_transaction(self, transaction_uid: int, wallet_owner: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -412,6 +496,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def reject_transaction(self, transaction_uid: int, wallet_owner: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -443,6 +528,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def revoke_transaction(self, transaction_uid: int, wallet_owner: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -475,6 +561,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def cancel_transaction(self, transaction_uid: int, wallet_owner: Address) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -522,6 +609,7 @@ class TransactionManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def try_execute_waiting_transactions(self) -> None:
         # Access
         #   - Only ICONSafe Proxy contract
@@ -577,6 +665,41 @@ class TransactionManager(
             for transaction_uid in self._rejected_transactions.select(offset)
         ]
 
+    @external(readonly=True)
+    @only_iconsafe
+    def get_waiting_transactions_from(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._waiting_transactions, cursor)
+
+    @external(readonly=True)
+    @only_iconsafe
+    def get_all_transactions_from(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._all_transactions, cursor)
+
+    @external(readonly=True)
+    @only_iconsafe
+    def get_executed_transactions_from(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._executed_transactions, cursor)
+
+    @external(readonly=True)
+    @only_iconsafe
+    def get_rejected_transactions_from(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._rejected_transactions, cursor)
+
+    @external(readonly=True)
+    @only_iconsafe
+    def get_all_transactions_reverse(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._all_transactions, cursor, reverse=True)
+
+    @external(readonly=True)
+    @only_iconsafe
+    def get_executed_transactions_reverse(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._executed_transactions, cursor, reverse=True)
+
+    @external(readonly=True)
+    @only_iconsafe
+    def get_rejected_transactions_reverse(self, cursor: int = 0) -> dict:
+        return self.__serialize_transactions_from(self._rejected_transactions, cursor, reverse=True)
+
     @external(readonly=True)
     @only_iconsafe
     def get_waiting_transactions_count(self) -> int:
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from iconservice import *
+from ..scorelib.struct import *
 
 
 class WalletOwner:
@@ -26,8 +27,12 @@ class WalletOwner:
     # ================================================
     def __init__(self, uid: int, db: IconScoreDatabase):
         name = f"{WalletOwner._NAME}_{uid}"
-        self._address = VarDB(f"{name}_address", db, value_type=Address)
-        self._name = VarDB(f"{name}_name", db, value_type=str)
+        self._record = StructDB(name, db, [
+            ("address", Address),
+            ("name", str),
+        ])
+        self._address = self._record.field("address")
+        self._name = self._record.field("name")
         self._uid = uid
         self._db = db
 
@@ -24,13 +24,20 @@ class WalletOwnerFactory:
     _NAME = "WALLET_OWNER_FACTORY"
 
     @staticmethod
-    def create(db: IconScoreDatabase, address: Address, name: str) -> int:
+    def reserve(db: IconScoreDatabase, count: int) -> range:
+        return IdFactory(WalletOwnerFactory._NAME, db).reserve(count)
 
-        wallet_owner_uid = IdFactory(WalletOwnerFactory._NAME, db).get_uid()
+    @staticmethod
+    def create(db: IconScoreDatabase, address: Address, name: str, wallet_owner_uid: int = None) -> int:
+
+        if wallet_owner_uid is None:
+            wallet_owner_uid = IdFactory(WalletOwnerFactory._NAME, db).get_uid()
 
         owner = WalletOwner(wallet_owner_uid, db)
 
-        owner._address.set(address)
-        owner._name.set(name)
+        owner._record.create({
+            "address": address,
+            "name": name
+        })
 
         return wallet_owner_uid
@@ -17,6 +17,8 @@
 from iconservice import *
 from ..scorelib.maintenance import *
 from ..scorelib.version import *
+from ..scorelib.auth import *
+from ..scorelib.consts import *
 from ..scorelib.linked_list import *
 
 from ..interfaces.wallet_owners_manager import *
@@ -58,17 +60,17 @@ class WalletOwnersManager(
     # ================================================
     #  Event Logs
     # ================================================
-    @add_event
+    @add_event(uid_arg="wallet_owner_uid")
     @eventlog(indexed=1)
     def WalletOwnerAddition(self, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event(uid_arg="wallet_owner_uid")
     @eventlog(indexed=1)
     def WalletOwnerRemoval(self, wallet_owner_uid: int):
         pass
 
-    @add_event
+    @add_event()
     @eventlog(indexed=1)
     def WalletOwnersRequiredChanged(self, required: int):
         pass
@@ -96,6 +98,10 @@ class WalletOwnersManager(
         # if self.is_less_than_target_version('1.0.0'):
         #     self._migrate_v1_0_0()
 
+        # The wallet owners list switched to the packed layout, migrate its first nodes.
+        # The remaining nodes are migrated with migrate_wallet_owners
+        self._wallet_owners.migrate()
+
         self.version_update(VERSION)
 
     @external(readonly=True)
@@ -142,16 +148,48 @@ class WalletOwnersManager(
             self.__check_address_doesnt_exist(address)
 
         # --- OK from here ---
-        for owner in owners:
+        wallet_owner_uids = []
+        for owner, wallet_owner_uid in zip(owners, WalletOwnerFactory.reserve(self.db, len(owners))):
             address, name = Address.from_string(owner["address"]), owner["name"]
-            wallet_owner_uid = WalletOwnerFactory.create(self.db, address, name)
-            self.__add_wallet_owner(address, wallet_owner_uid, emit_event)
+            WalletOwnerFactory.create(self.db, address, name, wallet_owner_uid)
+            self._address_to_uid_map[str(address)] = wallet_owner_uid
+            wallet_owner_uids.append(wallet_owner_uid)
+
+        self._wallet_owners.extend(wallet_owner_uids)
+
+        if emit_event:
+            for wallet_owner_uid in wallet_owner_uids:
+                self.WalletOwnerAddition(wallet_owner_uid)
+
+    # ================================================
+    #  OnlyOwner External methods
+    # ================================================
+    @external
+    @only_owner
+    def migrate_wallet_owners(self, max_count: int = MAX_ITERATION_LOOP) -> None:
+        # Access
+        #   - WalletOwnersManager contract operator only
+        # Description 
+        #   - Migrate a limited amount of nodes of the wallet owners list stored with the legacy layout.
+        #     Call it until get_wallet_owners_migrated returns True
+        # Parameters 
+        #   - max_count : maximum amount of nodes migrated, up to MAX_ITERATION_LOOP
+        # Returns
+        #   - Nothing
+        # Throws
+        #   - SenderNotScoreOwnerError
+        self._wallet_owners.migrate(min(max_count, MAX_ITERATION_LOOP))
+
+    @external(readonly=True)
+    def get_wallet_owners_migrated(self) -> bool:
+        return self._wallet_owners.is_migrated()
 
     # ================================================
     #  OnlyIconSafe External methods
     # ================================================
     @only_iconsafe
     @external
+    @batch_events
     def add_wallet_owner(self, address: Address, name: str) -> None:
         # Access
         #   Only ICONSafe Proxy contract
@@ -175,6 +213,7 @@ class WalletOwnersManager(
 
     @only_iconsafe
     @external
+    @batch_events
     def remove_wallet_owner(self, wallet_owner_uid: int) -> None:
         # Access
         #   Only ICONSafe Proxy contract
@@ -196,6 +235,7 @@ class WalletOwnersManager(
 
     @only_iconsafe
     @external
+    @batch_events
     def replace_wallet_owner(self, old_wallet_owner_uid: int, new_address: Address, new_name: str) -> None:
         # Access
         #   Only ICONSafe Proxy contract
@@ -231,6 +271,7 @@ class WalletOwnersManager(
 
     @only_iconsafe
     @external
+    @batch_events
     def set_wallet_owners_required(self, owners_required: int) -> None:
         # Access
         #   Only ICONSafe Proxy contract
@@ -38,7 +38,7 @@ class WalletSettingsManager(
     # ================================================
     #  Event Logs
     # ================================================
-    @add_event
+    @add_event()
     @eventlog
     def WalletSettingsSafeNameChanged(self, safe_name: str):
         pass
@@ -79,6 +79,7 @@ class WalletSettingsManager(
 
     @external
     @only_iconsafe
+    @batch_events
     def set_safe_name(self, safe_name: str) -> None:
         # Access
         #   Only ICONSafe Proxy contract
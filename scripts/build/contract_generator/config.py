@@ -45,9 +45,15 @@ scorelib_state = [
     "scorelib/state.py",
 ]
 
+scorelib_codec = [
+    "scorelib/__init__.py",
+    "scorelib/codec.py",
+]
+
 scorelib_iterabledict = [
     "scorelib/__init__.py",
     *scorelib_set,
+    *scorelib_codec,
     "scorelib/consts.py",
     "scorelib/iterable_dict.py",
 ]
@@ -57,9 +63,23 @@ scorelib_id_factory = [
     "scorelib/id_factory.py",
 ]
 
+scorelib_struct = [
+    "scorelib/__init__.py",
+    *scorelib_codec,
+    "scorelib/struct.py",
+]
+
+scorelib_heap = [
+    "scorelib/__init__.py",
+    *scorelib_codec,
+    "scorelib/consts.py",
+    "scorelib/heap.py",
+]
+
 scorelib_linkedlist = [
     "scorelib/__init__.py",
     *scorelib_id_factory,
+    *scorelib_codec,
     "scorelib/consts.py",
     "scorelib/linked_list.py",
 ]
@@ -172,6 +192,7 @@ type_converter = [
 # transaction_manager
 transaction = [
     *scorelib_state,
+    *scorelib_struct,
 ]
 
 outgoing_transaction = [
@@ -193,10 +214,12 @@ transaction_factory = [
 # balance_history
 balance_history = [
     *scorelib_id_factory,
+    *scorelib_struct,
 ]
 
 # wallet_owner
 wallet_owner = [
+    *scorelib_struct,
 ]
 
 wallet_owner_factory = [
@@ -218,6 +241,7 @@ config = {
         *scorelib_iterabledict,
         *scorelib_consts,
         *interface_address_registrar,
+        *domain,
     ],
     "balance_history_manager": [
         *scorelib_base,
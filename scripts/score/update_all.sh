@@ -17,8 +17,6 @@ function process {
 
     ./build.sh
 
-    echo "Updating address_registrar..."
-    ./scripts/score/update_score.sh -n ${network} -p address_registrar
     echo "Updating iconsafe..."
     ./scripts/score/update_score.sh -n ${network} -p iconsafe
     echo "Updating address_book..."
@@ -33,6 +31,9 @@ function process {
     ./scripts/score/update_score.sh -n ${network} -p wallet_owners_manager
     echo "Updating wallet_settings_manager..."
     ./scripts/score/update_score.sh -n ${network} -p wallet_settings_manager
+    # The registrar pushes the domain to the other contracts when updated, so it needs to be updated last
+    echo "Updating address_registrar..."
+    ./scripts/score/update_score.sh -n ${network} -p address_registrar
 }
 
 # Parameters
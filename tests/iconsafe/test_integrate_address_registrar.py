@@ -139,3 +139,131 @@ class TestIntegrateAddressRegistrar(ICONSafeTests):
         addresses.append(Address.from_string('hx' + 'c'*40))
         resolved = self.address_registrar_reverse_resolve_many(addresses)
         self.assertEqual(names, resolved)
+
+    def test_epoch(self):
+        address = Address.from_string('hx' + 'a'*40)
+        name = "test"
+        epoch = self.address_registrar_get_epoch()
+
+        # Register
+        self.address_registrar_register(name, address, from_=self._operator)
+        self.assertEqual(epoch + 1, self.address_registrar_get_epoch())
+
+        # Failure doesn't change the epoch
+        self.address_registrar_register(name, address, from_=self._operator, success=False)
+        self.assertEqual(epoch + 1, self.address_registrar_get_epoch())
+
+        # Unregister
+        self.address_registrar_unregister(name, from_=self._operator)
+        self.assertEqual(epoch + 2, self.address_registrar_get_epoch())
+
+    def test_domain_epoch(self):
+        address = Address.from_string('hx' + 'a'*40)
+        domain_epoch = self.address_registrar_get_domain_epoch()
+
+        # Not a domain contract
+        self.address_registrar_register("test", address, from_=self._operator)
+        self.assertEqual(domain_epoch, self.address_registrar_get_domain_epoch())
+
+        # Unregister and register again a domain contract
+        self.address_registrar_unregister("WALLET_SETTINGS_MANAGER_PROXY", from_=self._operator)
+        self.assertEqual(domain_epoch + 1, self.address_registrar_get_domain_epoch())
+        self.address_registrar_register("WALLET_SETTINGS_MANAGER_PROXY", self._wallet_settings_manager, from_=self._operator)
+        self.assertEqual(domain_epoch + 2, self.address_registrar_get_domain_epoch())
+
+        # The domain contracts use the new domain
+        result = self.set_wallet_owners_required(2)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+
+    def test_get_registrations(self):
+        addresses = [Address.from_string('hx' + 'a'*40), Address.from_string('hx' + 'b'*40)]
+        names = ["test1", "test2"]
+        self.address_registrar_register(names[0], addresses[0], from_=self._operator)
+        self.address_registrar_register(names[1], addresses[1], from_=self._operator)
+
+        result = self.address_registrar_get_registrations()
+        self.assertEqual(result['next_cursor'], '0x0')
+        self.assertEqual(int(result['epoch'], 0), self.address_registrar_get_epoch())
+        self.assertEqual(result['items'][names[0]], str(addresses[0]))
+        self.assertEqual(result['items'][names[1]], str(addresses[1]))
+        self.assertEqual(result['items']["ICONSAFE_PROXY"], str(self._score_address))
+
+    def test_get_registrations_cursor(self):
+        names = [f"test{i}" for i in range(110)]
+        addresses = [Address.from_string('hx' + f"{i:040x}") for i in range(1, 111)]
+        for name, address in zip(names, addresses):
+            self.address_registrar_register(name, address, from_=self._operator)
+
+        # success case: the registrations are split in pages
+        first = self.address_registrar_get_registrations()
+        self.assertEqual(100, len(first['items']))
+        self.assertNotEqual(0, int(first['next_cursor'], 0))
+
+        last = self.address_registrar_get_registrations(int(first['next_cursor'], 0))
+        self.assertEqual(0, int(last['next_cursor'], 0))
+        items = {**first['items'], **last['items']}
+        for name, address in zip(names, addresses):
+            self.assertEqual(str(address), items[name])
+
+        # failure case: the registrar changed since the cursor was returned
+        self.address_registrar_unregister(names[0], from_=self._operator)
+        with self.assertRaises(Exception):
+            self.address_registrar_get_registrations(int(first['next_cursor'], 0))
+
+    def test_unregister_register_domain(self):
+        # Unregister the transaction manager : it can't be reached by the domain anymore
+        self.address_registrar_unregister("TRANSACTION_MANAGER_PROXY", from_=self._operator)
+        self.set_wallet_owners_required(2, success=False)
+
+        # Register it again
+        self.address_registrar_register("TRANSACTION_MANAGER_PROXY", self._transaction_manager, from_=self._operator)
+
+        # TransactionManager only_iconsafe and ICONSafe only_transaction_manager still authorize the domain
+        result = self.set_wallet_owners_required(2)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+        self.assertEqual(2, self.get_wallet_owners_required())
+
+        # Unregister the ICONSafe : the transaction manager rejects it
+        self.address_registrar_unregister("ICONSAFE_PROXY", from_=self._operator)
+        self.set_wallet_owners_required(1, success=False)
+
+        # Register it again
+        self.address_registrar_register("ICONSAFE_PROXY", self._score_address, from_=self._operator)
+
+        result = self.set_wallet_owners_required(1)
+        txuid = self.get_transaction_created_uid(result)
+        self.confirm_transaction(txuid, from_=self._owner2)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+        self.assertEqual(1, self.get_wallet_owners_required())
+
+    def test_synchronize(self):
+        # Push the domain again to a registered domain contract
+        self.address_registrar_synchronize("TRANSACTION_MANAGER_PROXY", from_=self._operator)
+
+        result = self.set_wallet_owners_required(2)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+
+        # Not operator
+        self.address_registrar_synchronize("TRANSACTION_MANAGER_PROXY", from_=self._attacker, success=False)
+
+        # Not registered
+        self.address_registrar_synchronize("test", from_=self._operator, success=False)
+
+    def test_only_domain(self):
+        # Not a domain member
+        self._do_call(self._attacker, 'on_add_event', {}, False, to_=self._event_manager)
+        self._do_call(self._operator, 'on_add_event', {}, False, to_=self._event_manager)
+
+        # Unregister and register again a domain member
+        self.address_registrar_unregister("WALLET_OWNERS_MANAGER_PROXY", from_=self._operator)
+        self.address_registrar_register("WALLET_OWNERS_MANAGER_PROXY", self._wallet_owners_manager, from_=self._operator)
+
+        # The wallet owners manager events are still accepted by the event manager
+        result = self.add_wallet_owner(self._user.get_address(), "new_owner")
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+        self.assertEqual(4, self.get_wallet_owners_count())
+        self.assertEqual(result['txHash'], self.get_events_from()['items'][0]['hash'])
@@ -63,3 +63,31 @@ class TestIntegrateConfirmOrRejectAfterRequiredOwnersChange(ICONSafeTests):
 
         # waiting_txuid should have been executed
         self.assertEqual("REJECTED", self.get_transaction(waiting_txuid)['state'])
+
+    def test_integrate_confirm_many_after_required_owners_change(self):
+        # Change owners count to 2
+        result = self.set_wallet_owners_required(2)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+
+        # Create two single-confirmed transactions (1/2), keeping the owners count to 1 once executed
+        result = self.set_wallet_owners_required(1)
+        first_txuid = self.get_transaction_created_uid(result)
+        result = self.set_wallet_owners_required(1)
+        second_txuid = self.get_transaction_created_uid(result)
+
+        # Create a transaction without any vote (0/2)
+        result = self.set_wallet_owners_required(3)
+        revoked_txuid = self.get_transaction_created_uid(result)
+        self.revoke_transaction(revoked_txuid)
+
+        # Change owners count back to 1 and execute it (2/2)
+        result = self.set_wallet_owners_required(1)
+        txuid = self.get_transaction_created_uid(result)
+        result = self.confirm_transaction(txuid, from_=self._owner2)
+
+        # Both single-confirmed transactions should have been executed
+        self.assertEqual("EXECUTED", self.get_transaction(first_txuid)['state'])
+        self.assertEqual("EXECUTED", self.get_transaction(second_txuid)['state'])
+        # The revoked transaction has no vote anymore
+        self.assertEqual("WAITING", self.get_transaction(revoked_txuid)['state'])
@@ -20,6 +20,7 @@ from iconservice import *
 from tests.msw_utils import ICONSafeTests
 from tests.utils import *
 from contracts.transaction_manager.transaction_manager import *
+from contracts.balance_history_manager.consts import ICX_TOKEN_ADDRESS
 
 
 class TestIntegrateReadOnly(ICONSafeTests):
@@ -75,6 +76,95 @@ class TestIntegrateReadOnly(ICONSafeTests):
         self.assertEqual(str(self._score_address), transaction["sub_transactions"][0]["destination"])
         self.assertEqual("set_wallet_owners_required", transaction["sub_transactions"][0]["method_name"])
 
+    def test_get_transaction_list_from_cursor(self):
+        self.set_wallet_owners_required(2)
+
+        txcounts = 110
+        txuids = []
+        for _ in range(txcounts):
+            result = self.set_wallet_owners_required(3)
+            txuids.append(self.get_transaction_created_uid(result))
+
+        # success case: first page starts from the head and returns the cursor of the next page
+        page = self.get_waiting_transactions_from()
+        self.assertEqual(100, len(page["items"]))
+        self.assertEqual(txuids[0:100], [int(transaction["uid"], 0) for transaction in page["items"]])
+        self.assertEqual(txuids[100], int(page["next_cursor"], 0))
+
+        # success case: last page returns the remaining items and a null cursor
+        page = self.get_waiting_transactions_from(txuids[100])
+        self.assertEqual(txuids[100:], [int(transaction["uid"], 0) for transaction in page["items"]])
+        self.assertEqual(0, int(page["next_cursor"], 0))
+
+        # success case: start from any transaction of the list
+        page = self.get_waiting_transactions_from(txuids[105])
+        self.assertEqual(txuids[105:], [int(transaction["uid"], 0) for transaction in page["items"]])
+
+    def test_get_transaction_list_reverse(self):
+        txcounts = 110
+        txuids = []
+        for _ in range(txcounts):
+            result = self.set_wallet_owners_required(1)
+            txuids.append(self.get_transaction_created_uid(result))
+        txuids.reverse()
+
+        # success case: first page starts from the most recent transaction
+        page = self.get_all_transactions_reverse()
+        self.assertEqual(100, len(page["items"]))
+        self.assertEqual(txuids[0:100], [int(transaction["uid"], 0) for transaction in page["items"]])
+        self.assertEqual(txuids[100], int(page["next_cursor"], 0))
+
+        # success case: last page returns the oldest transactions and a null cursor
+        page = self.get_all_transactions_reverse(txuids[100])
+        self.assertEqual(txuids[100:], [int(transaction["uid"], 0) for transaction in page["items"]])
+        self.assertEqual(0, int(page["next_cursor"], 0))
+
+    def test_get_transaction_list_offsets(self):
+        executed_uids = []
+        all_uids = []
+        for _ in range(30):
+            result = self.set_wallet_owners_required(1)
+            executed_uids.append(self.get_transaction_created_uid(result))
+            all_uids.append(self.get_transaction_created_uid(result))
+
+        result = self.set_wallet_owners_required(2)
+        executed_uids.append(self.get_transaction_created_uid(result))
+        all_uids.append(self.get_transaction_created_uid(result))
+
+        waiting_uids = []
+        for _ in range(10):
+            result = self.set_wallet_owners_required(2)
+            waiting_uids.append(self.get_transaction_created_uid(result))
+            all_uids.append(self.get_transaction_created_uid(result))
+
+        # Remove waiting transactions from the first, middle and last indexed nodes
+        for uid in [waiting_uids[0], waiting_uids[5], waiting_uids[9]]:
+            result = self.force_cancel_transaction(uid)
+            txuid = self.get_transaction_created_uid(result)
+            all_uids.append(txuid)
+            self.confirm_transaction(txuid, from_=self._owner2)
+            executed_uids.append(txuid)
+            all_uids.remove(uid)
+
+        for _ in range(5):
+            result = self.set_wallet_owners_required(2)
+            all_uids.append(self.get_transaction_created_uid(result))
+
+        self.build_transactions_index(100)
+        self.assertTrue(self.get_transactions_indexed())
+
+        # success case: the transactions at any offset match the lists content
+        for offset in [0, 1, 7, 20, len(executed_uids) - 1, len(executed_uids), len(executed_uids) + 5]:
+            transactions = self.get_executed_transactions(offset)
+            self.assertEqual(executed_uids[offset:offset + 100], [int(transaction["uid"], 0) for transaction in transactions])
+
+        for offset in [0, 1, 7, 30, 40, len(all_uids) - 1, len(all_uids), len(all_uids) + 5]:
+            transactions = self.get_all_transactions(offset)
+            self.assertEqual(all_uids[offset:offset + 100], [int(transaction["uid"], 0) for transaction in transactions])
+
+        # failure case: not the transaction manager owner
+        self.build_transactions_index(10, from_=self._attacker, success=False)
+
     def test_get_wallet_owners(self):
         owners_wallets = [str(create_address()) for x in range(0, 50)]
         owners = list(map(lambda x: {"address": str(x[1]), "name": str(x[0])}, enumerate(owners_wallets)))
@@ -184,3 +274,201 @@ class TestIntegrateReadOnly(ICONSafeTests):
 
         count = self.get_wallet_owners_count()
         self.assertEqual(3, count)
+
+    def test_get_events_from_once_per_transaction(self):
+        # success case: the submit and the execution events register the transaction once
+        result = self.set_wallet_owners_required(2)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+
+        hashes = [event["hash"] for event in self.get_events_from()["items"]]
+        self.assertEqual(result["txHash"], hashes[0])
+        self.assertEqual(1, hashes.count(result["txHash"]))
+
+        # success case: the confirmation and the execution events register the transaction once
+        result = self.add_wallet_owner(self._user.get_address(), "new_owner")
+        txuid = self.get_transaction_created_uid(result)
+        result = self.confirm_transaction(txuid, from_=self._owner2)
+        txuid = self.get_transaction_execution_success_uid(result)
+
+        hashes = [event["hash"] for event in self.get_events_from()["items"]]
+        self.assertEqual(result["txHash"], hashes[0])
+        self.assertEqual(1, hashes.count(result["txHash"]))
+
+        # success case: the events of a rollbacked execution don't register the transaction twice
+        sub_transactions = []
+        sub_transactions.append(self.add_wallet_owner_params(self._attacker.get_address(), "attacker"))
+        sub_transactions.append(self.add_wallet_owner_params(self._operator.get_address(), "operator again"))
+
+        result = self.submit_transaction(self._operator, sub_transactions)
+        txuid = self.get_transaction_created_uid(result)
+        result = self.confirm_transaction(txuid, from_=self._owner2)
+        txuid, error = self.get_transaction_execution_failure_uid(result)
+        self.assertEqual("FAILED", self.get_transaction(txuid)['state'])
+        self.assertEqual(4, self.get_wallet_owners_count())
+
+        hashes = [event["hash"] for event in self.get_events_from()["items"]]
+        self.assertEqual(result["txHash"], hashes[0])
+        self.assertEqual(1, hashes.count(result["txHash"]))
+
+    def test_get_event_records_from(self):
+        # success case: each owner added by the same transaction has its own record
+        sub_transactions = []
+        sub_transactions.append(self.add_wallet_owner_params(self._user.get_address(), "user"))
+        sub_transactions.append(self.add_wallet_owner_params(self._attacker.get_address(), "attacker"))
+
+        result = self.submit_transaction(self._operator, sub_transactions)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+
+        user_uid = self.get_wallet_owner_uid(self._user.get_address())
+        attacker_uid = self.get_wallet_owner_uid(self._attacker.get_address())
+
+        page = self.get_type_event_records_from("WalletOwnerAddition")
+        self.assertEqual([attacker_uid, user_uid], [int(record["primary_uid"], 0) for record in page["items"]])
+        self.assertEqual(0, int(page["next_cursor"], 0))
+        for record in page["items"]:
+            self.assertEqual(result["txHash"], record["hash"])
+            self.assertEqual(str(self._wallet_owners_manager), record["emitter"])
+            self.assertEqual("WalletOwnerAddition", record["type"])
+
+        # success case: the wallet owners manager feed only contains its own records
+        page = self.get_emitter_event_records_from(self._wallet_owners_manager)
+        self.assertEqual([attacker_uid, user_uid], [int(record["primary_uid"], 0) for record in page["items"]])
+
+        # success case: the wallet owners manager records are sent during the execution,
+        # the transaction manager records once its call returns
+        page = self.get_event_records_from()
+        records = [record for record in page["items"] if record["hash"] == result["txHash"]]
+        self.assertEqual([
+            "TransactionExecutionSuccess",
+            "TransactionConfirmed",
+            "TransactionCreated",
+            "WalletOwnerAddition",
+            "WalletOwnerAddition"
+        ], [record["type"] for record in records])
+        self.assertEqual([txuid, txuid, txuid, attacker_uid, user_uid], [int(record["primary_uid"], 0) for record in records])
+        self.assertEqual(str(self._transaction_manager), records[0]["emitter"])
+
+    def test_get_event_records_from_balance_history(self):
+        # Track the IRC2 token
+        self.add_balance_tracker(self._irc2_address)
+
+        # Deposit funds to the multisig
+        self.deposit_icx_to_multisig_score(10000)
+        self.send_token(10000, self._score_address)
+
+        # success case: each token balance updated by the same transaction has its own record
+        sub_transactions = []
+        sub_transactions.append(self.msw_transfer_icx_params(self._user.get_address(), 1000))
+        sub_transactions.append(self.msw_transfer_irc2_params(self._irc2_address, self._user.get_address(), 500))
+
+        result = self.submit_transaction(self._operator, sub_transactions)
+        txuid = self.get_transaction_execution_success_uid(result)
+        self.assertEqual("EXECUTED", self.get_transaction(txuid)['state'])
+
+        balance_history_uids = [
+            int(self.get_token_balance_history(ICX_TOKEN_ADDRESS)[0]["uid"], 0),
+            int(self.get_token_balance_history(self._irc2_address)[0]["uid"], 0)
+        ]
+
+        page = self.get_emitter_event_records_from(self._balance_history_manager)
+        records = [record for record in page["items"] if record["hash"] == result["txHash"]]
+        self.assertEqual(2, len(records))
+        self.assertEqual(sorted(balance_history_uids), sorted([int(record["primary_uid"], 0) for record in records]))
+        for record in records:
+            self.assertEqual("BalanceHistoryCreated", record["type"])
+
+    def test_get_event_records_from_failure(self):
+        self.deposit_icx_to_multisig_score(100)
+
+        # The wallet owner is added, then the transfer fails : the whole execution is reverted
+        sub_transactions = []
+        sub_transactions.append(self.add_wallet_owner_params(self._user.get_address(), "new_owner"))
+        sub_transactions.append(self.msw_transfer_icx_params(self._user.get_address(), 10000000))
+
+        result = self.submit_transaction(self._operator, sub_transactions)
+        txuid = self.get_transaction_created_uid(result)
+        self.assertEqual("FAILED", self.get_transaction(txuid)['state'])
+
+        # success case: the records of the reverted execution aren't registered
+        page = self.get_type_event_records_from("WalletOwnerAddition")
+        self.assertEqual([], [record for record in page["items"] if record["hash"] == result["txHash"]])
+
+        page = self.get_event_records_from()
+        records = [record for record in page["items"] if record["hash"] == result["txHash"]]
+        self.assertEqual([
+            "TransactionExecutionFailure",
+            "TransactionConfirmed",
+            "TransactionCreated"
+        ], [record["type"] for record in records])
+        for record in records:
+            self.assertEqual(txuid, int(record["primary_uid"], 0))
+
+    def test_get_event_records_from_cursor(self):
+        txcounts = 110
+        txuids = []
+        for _ in range(txcounts):
+            result = self.set_wallet_owners_required(1)
+            txuids.append(self.get_transaction_execution_success_uid(result))
+        txuids.reverse()
+
+        # success case: first page starts from the most recent record and returns the cursor of the next page
+        page = self.get_type_event_records_from("TransactionCreated")
+        self.assertEqual(100, len(page["items"]))
+        self.assertEqual(txuids[0:100], [int(record["primary_uid"], 0) for record in page["items"]])
+        self.assertNotEqual(0, int(page["next_cursor"], 0))
+
+        # success case: last page returns the oldest records and a null cursor
+        next_cursor = int(page["next_cursor"], 0)
+        page = self.get_type_event_records_from("TransactionCreated", next_cursor)
+        self.assertEqual(next_cursor, int(page["items"][0]["uid"], 0))
+        self.assertEqual(txuids[100:], [int(record["primary_uid"], 0) for record in page["items"]])
+        self.assertEqual(0, int(page["next_cursor"], 0))
+
+        # success case: the emitter feed pages the same way
+        page = self.get_emitter_event_records_from(self._wallet_owners_manager)
+        self.assertEqual(100, len(page["items"]))
+        self.assertEqual(["WalletOwnersRequiredChanged"], list(set(record["type"] for record in page["items"])))
+        # The required owners change isn't about a single entity
+        self.assertEqual([0], list(set(int(record["primary_uid"], 0) for record in page["items"])))
+        page = self.get_emitter_event_records_from(self._wallet_owners_manager, int(page["next_cursor"], 0))
+        self.assertEqual(txcounts - 100, len(page["items"]))
+        self.assertEqual(0, int(page["next_cursor"], 0))
+
+        # success case: the global feed pages over the records of all the emitters
+        page = self.get_event_records_from()
+        self.assertEqual(100, len(page["items"]))
+        next_cursor = int(page["next_cursor"], 0)
+        page = self.get_event_records_from(next_cursor)
+        self.assertEqual(next_cursor, int(page["items"][0]["uid"], 0))
+
+    def test_migrate_events(self):
+        self.set_wallet_owners_required(1)
+
+        # success case: the events list is already in the packed layout
+        self.migrate_events(10)
+        self.assertTrue(self.get_events_migrated())
+
+        # failure case: not the event manager owner
+        self.migrate_events(10, from_=self._attacker, success=False)
+
+    def test_migrate_lists(self):
+        self.set_wallet_owners_required(2)
+        self.set_wallet_owners_required(3)
+        self.deposit_icx_to_multisig_score(100)
+
+        # success case: the lists are already in the packed layout
+        self.migrate_transactions(10)
+        self.assertTrue(self.get_transactions_migrated())
+
+        self.migrate_wallet_owners(10)
+        self.assertTrue(self.get_wallet_owners_migrated())
+
+        self.migrate_balance_history(ICX_TOKEN_ADDRESS, 10)
+        self.assertTrue(self.get_balance_history_migrated(ICX_TOKEN_ADDRESS))
+
+        # failure case: not the contracts owner
+        self.migrate_transactions(10, from_=self._attacker, success=False)
+        self.migrate_wallet_owners(10, from_=self._attacker, success=False)
+        self.migrate_balance_history(ICX_TOKEN_ADDRESS, 10, from_=self._attacker, success=False)
@@ -188,6 +188,107 @@ class ICONSafeTests(IconIntegrateTestBase):
             ), 0
         ) != 0
 
+    def get_events_migrated(self) -> bool:
+        return int(
+            icx_call(
+                super(),
+                from_=self._operator.get_address(),
+                to_=self._event_manager,
+                method="get_events_migrated",
+                icon_service=self.icon_service
+            ), 0
+        ) != 0
+
+    def migrate_events(self, max_count: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            'migrate_events',
+            {'max_count': str(max_count)},
+            success,
+            to_=self._event_manager
+        )
+
+    def get_transactions_migrated(self) -> bool:
+        return int(
+            icx_call(
+                super(),
+                from_=self._operator.get_address(),
+                to_=self._transaction_manager,
+                method="get_transactions_migrated",
+                icon_service=self.icon_service
+            ), 0
+        ) != 0
+
+    def migrate_transactions(self, max_count: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            'migrate_transactions',
+            {'max_count': str(max_count)},
+            success,
+            to_=self._transaction_manager
+        )
+
+    def get_transactions_indexed(self) -> bool:
+        return int(
+            icx_call(
+                super(),
+                from_=self._operator.get_address(),
+                to_=self._transaction_manager,
+                method="get_transactions_indexed",
+                icon_service=self.icon_service
+            ), 0
+        ) != 0
+
+    def build_transactions_index(self, max_count: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            'build_transactions_index',
+            {'max_count': str(max_count)},
+            success,
+            to_=self._transaction_manager
+        )
+
+    def get_wallet_owners_migrated(self) -> bool:
+        return int(
+            icx_call(
+                super(),
+                from_=self._operator.get_address(),
+                to_=self._wallet_owners_manager,
+                method="get_wallet_owners_migrated",
+                icon_service=self.icon_service
+            ), 0
+        ) != 0
+
+    def migrate_wallet_owners(self, max_count: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            'migrate_wallet_owners',
+            {'max_count': str(max_count)},
+            success,
+            to_=self._wallet_owners_manager
+        )
+
+    def get_balance_history_migrated(self, token: Address) -> bool:
+        return int(
+            icx_call(
+                super(),
+                from_=self._operator.get_address(),
+                to_=self._balance_history_manager,
+                method="get_balance_history_migrated",
+                params={'token': str(token)},
+                icon_service=self.icon_service
+            ), 0
+        ) != 0
+
+    def migrate_balance_history(self, token: Address, max_count: int, from_=None, success=True):
+        return self._do_call(
+            from_,
+            'migrate_balance_history',
+            {'token': str(token), 'max_count': str(max_count)},
+            success,
+            to_=self._balance_history_manager
+        )
+
     def get_waiting_transactions_count(self) -> int:
         return int(
             icx_call(
@@ -209,6 +310,76 @@ class ICONSafeTests(IconIntegrateTestBase):
             icon_service=self.icon_service
         )
 
+    def get_waiting_transactions_from(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_waiting_transactions_from",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_events_from(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_events_from",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_event_records_from(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_event_records_from",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_emitter_event_records_from(self, emitter: Address, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_emitter_event_records_from",
+            params={"emitter": str(emitter), "cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_type_event_records_from(self, event_type: str, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_type_event_records_from",
+            params={"event_type": event_type, "cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_all_transactions_reverse(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_all_transactions_reverse",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
+    def get_all_transactions(self, offset: int = 0) -> list:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._score_address,
+            method="get_all_transactions",
+            params={"offset": offset},
+            icon_service=self.icon_service
+        )
+
     def get_executed_transactions(self, offset: int = 0) -> list:
         return icx_call(
             super(),
@@ -350,6 +521,15 @@ class ICONSafeTests(IconIntegrateTestBase):
             to_ = self._registrar_address
         )
 
+    def address_registrar_synchronize(self, name: str, from_=None, success=True):
+        return self._do_call(
+            from_,
+            'synchronize',
+            {'name': name},
+            success,
+            to_ = self._registrar_address
+        )
+
     def address_registrar_resolve(self, name: str) -> Address:
         result = icx_call(
             super(),
@@ -392,6 +572,34 @@ class ICONSafeTests(IconIntegrateTestBase):
             icon_service=self.icon_service
         )
 
+    def address_registrar_get_epoch(self) -> int:
+        return int(icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._registrar_address,
+            method="get_epoch",
+            icon_service=self.icon_service
+        ), 0)
+
+    def address_registrar_get_domain_epoch(self) -> int:
+        return int(icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._registrar_address,
+            method="get_domain_epoch",
+            icon_service=self.icon_service
+        ), 0)
+
+    def address_registrar_get_registrations(self, cursor: int = 0) -> dict:
+        return icx_call(
+            super(),
+            from_=self._operator.get_address(),
+            to_=self._registrar_address,
+            method="get_registrations",
+            params={"cursor": cursor},
+            icon_service=self.icon_service
+        )
+
     def add_balance_tracker(self, token: Address, params=None, from_=None, success=True):
         return self._do_call(
             from_,
@@ -486,19 +694,21 @@ class ICONSafeTests(IconIntegrateTestBase):
         return self.submit_transaction(from_, [params], success)
 
     def add_wallet_owner(self, address: Address, name: str, from_=None, success=True):
+        params = self.add_wallet_owner_params(address, name)
+        return self.submit_transaction(from_, [params], success)
+
+    def add_wallet_owner_params(self, address: Address, name: str):
         params = [
             {'name': 'address', 'type': 'Address', 'value': address},
             {'name': 'name', 'type': 'str', 'value': name}
         ]
 
-        params = self._create_submit_transaction_params(
+        return self._create_submit_transaction_params(
             {'destination': str(self._score_address),
              'method_name': "add_wallet_owner",
              'params': json.dumps(params),
              'description': f'Add new owner : {address}'})
 
-        return self.submit_transaction(from_, [params], success)
-
     def remove_wallet_owner(self, wallet_owner_uid: int, from_=None, success=True):
         params = [
             {'name': 'wallet_owner_uid', 'type': 'int', 'value': str(wallet_owner_uid)},